@@ -1,35 +1,14 @@
 #!/usr/bin/env python3
 """Live API smoke test: health check and model listing (no auth required)."""
 import sys
-from contextlib import contextmanager
-from pathlib import Path
 
 from visgate_sdk import Client
 
-
-@contextmanager
-def _tee_stdout():
-    out_dir = Path(__file__).resolve().parent / "sample_outputs"
-    out_dir.mkdir(exist_ok=True)
-    f = open(out_dir / f"out_{Path(__file__).stem}.txt", "w")
-    old = sys.stdout
-    class Tee:
-        def write(self, s):
-            old.write(s)
-            f.write(s)
-        def flush(self):
-            old.flush()
-            f.flush()
-    sys.stdout = Tee()
-    try:
-        yield
-    finally:
-        sys.stdout = old
-        f.close()
+from _common import tee_stdout
 
 
 def main() -> int:
-    with _tee_stdout():
+    with tee_stdout(__file__):
         client = Client(api_key="not-used")
         try:
             health = client.health()
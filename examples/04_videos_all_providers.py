@@ -3,107 +3,75 @@ Step 06: Video checks (managed + BYOK providers). Tested against live API.
 """
 from __future__ import annotations
 
-import os
-import sys
-from contextlib import contextmanager
+import asyncio
 from pathlib import Path
 
 import httpx
 
-from visgate_sdk import Client
-
-
-def _pk(p: str) -> str | None:
-    m = {"fal": ("VISGATE_FAL_API_KEY", "FAL_KEY"), "replicate": ("VISGATE_REPLICATE_API_KEY", "REPLICATE_API_KEY"), "runway": ("VISGATE_RUNWAY_API_KEY", "RUNWAY_API_KEY")}
-    for var in m.get(p, ()):
-        v = os.getenv(var, "").strip()
-        if v:
-            return v
-    return None
-
-
-@contextmanager
-def _tee_stdout():
-    out_dir = Path(__file__).resolve().parent / "sample_outputs"
-    out_dir.mkdir(exist_ok=True)
-    f = open(out_dir / f"out_{Path(__file__).stem}.txt", "w")
-    old = sys.stdout
-    class Tee:
-        def write(self, s):
-            old.write(s)
-            f.write(s)
-        def flush(self):
-            old.flush()
-            f.flush()
-    sys.stdout = Tee()
-    try:
-        yield
-    finally:
-        sys.stdout = old
-        f.close()
-
-
-def _create_client() -> Client:
-    base_url = os.getenv("VISGATE_BASE_URL", "https://visgateai.com/api/v1").strip()
-    return Client(base_url=base_url, fal_key=_pk("fal"), replicate_key=_pk("replicate"), runway_key=_pk("runway"))
+from _common import (
+    OUT_DIR,
+    async_download,
+    async_download_client,
+    create_async_client,
+    provider_key,
+    report_results,
+    tee_stdout,
+)
+
+
+BYOK_VIDEOS = [
+    ("fal", "fal-ai/veo3", 6.0),
+    ("replicate", "replicate/lucataco/cogvideox-5b", 5.0),
+    ("runway", "runway/gen4_turbo", 5.0),
+]
+
+
+async def _run_managed(prompt: str, out_dir: Path, dl: httpx.AsyncClient) -> list[str]:
+    async with create_async_client() as client:
+        managed = await client.videos.generate(
+            model="fal-ai/veo3",
+            prompt=prompt,
+            duration_seconds=6.0,
+            skip_gcs_upload=True,
+        )
+    if getattr(managed, "video_url", None):
+        await async_download(dl, managed.video_url, out_dir / "04_videos_sample.mp4")
+    return [f"managed_video_id={managed.id}"]
+
+
+async def _run_byok(provider: str, model: str, duration: float, prompt: str) -> list[str]:
+    key = provider_key(provider)
+    if not key:
+        return [f"{provider}_video_skipped=true"]
+    async with create_async_client(**{f"{provider}_key": key}) as client:
+        result = await client.videos.generate(
+            model=model,
+            prompt=prompt,
+            duration_seconds=duration,
+            skip_gcs_upload=True,
+        )
+    return [f"{provider}_video_id={result.id}"]
+
+
+async def _run(out_dir: Path) -> None:
+    prompt = "Short cinematic drone shot over Istanbul at golden hour"
+    async with async_download_client() as dl:
+        # return_exceptions keeps one failing provider from cancelling the others, and
+        # every download has finished before dl is closed.
+        results = await asyncio.gather(
+            _run_managed(prompt, out_dir, dl),
+            *(_run_byok(provider, model, secs, prompt) for provider, model, secs in BYOK_VIDEOS),
+            return_exceptions=True,
+        )
+    names = ["managed", *(provider for provider, _, _ in BYOK_VIDEOS)]
+    failures = report_results(names, results, "video")
+    if failures:
+        raise failures[0]
 
 
 def main() -> None:
-    out_dir = Path(__file__).resolve().parent / "sample_outputs"
-    with _tee_stdout():
-        prompt = "Short cinematic drone shot over Istanbul at golden hour"
-
-        with _create_client() as client:
-            client.set_provider_headers()
-            managed = client.videos.generate(
-                model="fal-ai/veo3",
-                prompt=prompt,
-                duration_seconds=6.0,
-                skip_gcs_upload=True,
-            )
-            print(f"managed_video_id={managed.id}")
-            if getattr(managed, "video_url", None):
-                r = httpx.get(managed.video_url, follow_redirects=True)
-                (out_dir / "04_videos_sample.mp4").write_bytes(r.content)
-
-            fal = _pk("fal")
-            if fal:
-                client.set_provider_headers(fal_key=fal)
-                result = client.videos.generate(
-                    model="fal-ai/veo3",
-                    prompt=prompt,
-                    duration_seconds=6.0,
-                    skip_gcs_upload=True,
-                )
-                print(f"fal_video_id={result.id}")
-            else:
-                print("fal_video_skipped=true")
-
-            replicate = _pk("replicate")
-            if replicate:
-                client.set_provider_headers(replicate_key=replicate)
-                result = client.videos.generate(
-                    model="replicate/lucataco/cogvideox-5b",
-                    prompt=prompt,
-                    duration_seconds=5.0,
-                    skip_gcs_upload=True,
-                )
-                print(f"replicate_video_id={result.id}")
-            else:
-                print("replicate_video_skipped=true")
-
-            runway = _pk("runway")
-            if runway:
-                client.set_provider_headers(runway_key=runway)
-                result = client.videos.generate(
-                    model="runway/gen4_turbo",
-                    prompt=prompt,
-                    duration_seconds=5.0,
-                    skip_gcs_upload=True,
-                )
-                print(f"runway_video_id={result.id}")
-            else:
-                print("runway_video_skipped=true")
+    with tee_stdout(__file__):
+        asyncio.run(_run(OUT_DIR))
 
 
 if __name__ == "__main__":
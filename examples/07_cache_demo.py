@@ -2,57 +2,18 @@
 """Step 09: Cache demo — two identical image requests, second should be cache hit."""
 from __future__ import annotations
 
-import os
 import sys
-from contextlib import contextmanager
-from pathlib import Path
 
-import httpx
-
-from visgate_sdk import Client
-
-
-@contextmanager
-def _tee_stdout():
-    out_dir = Path(__file__).resolve().parent / "sample_outputs"
-    out_dir.mkdir(exist_ok=True)
-    f = open(out_dir / f"out_{Path(__file__).stem}.txt", "w")
-    old = sys.stdout
-    class Tee:
-        def write(self, s):
-            old.write(s)
-            f.write(s)
-        def flush(self):
-            old.flush()
-            f.flush()
-    sys.stdout = Tee()
-    try:
-        yield
-    finally:
-        sys.stdout = old
-        f.close()
-
-
-def _create_client() -> Client:
-    base_url = os.getenv("VISGATE_BASE_URL", "https://visgateai.com/api/v1").strip()
-    def _pk(p: str) -> str | None:
-        m = {"fal": ("VISGATE_FAL_API_KEY", "FAL_KEY"), "replicate": ("VISGATE_REPLICATE_API_KEY", "REPLICATE_API_KEY"), "runway": ("VISGATE_RUNWAY_API_KEY", "RUNWAY_API_KEY")}
-        for var in m.get(p, ()):
-            v = os.getenv(var, "").strip()
-            if v:
-                return v
-        return None
-    return Client(base_url=base_url, fal_key=_pk("fal"), replicate_key=_pk("replicate"), runway_key=_pk("runway"))
+from _common import OUT_DIR, create_client, download, download_client, tee_stdout
 
 
 def main() -> int:
-    out_dir = Path(__file__).resolve().parent / "sample_outputs"
-    with _tee_stdout():
+    with tee_stdout(__file__):
         prompt = "Istanbul Bosphorus at golden hour, minarets visible, cinematic"
         model = "fal-ai/flux/schnell"
         width, height = 1024, 1024
 
-        with _create_client() as client:
+        with create_client() as client, download_client() as dl:
             r1 = client.images.generate(
                 model=model,
                 prompt=prompt,
@@ -62,8 +23,7 @@ def main() -> int:
             )
             print(f"Request 1: cache_hit={r1.cache_hit}, latency_ms={r1.latency_ms}, cost={r1.cost}")
             if r1.images:
-                r = httpx.get(r1.images[0], follow_redirects=True)
-                (out_dir / "cache_demo.jpg").write_bytes(r.content)
+                download(dl, r1.images[0], OUT_DIR / "cache_demo.jpg")
 
             r2 = client.images.generate(
                 model=model,
@@ -3,42 +3,11 @@ Step 16: Live regression smoke — managed mode, exact cache, semantic cache, as
 """
 from __future__ import annotations
 
-import os
-import sys
 import time
-from contextlib import contextmanager
-from pathlib import Path
 
-from visgate_sdk import Client
+from visgate_sdk import GenerationRequest
 
-
-@contextmanager
-def _tee_stdout():
-    out_dir = Path(__file__).resolve().parent / "sample_outputs"
-    out_dir.mkdir(exist_ok=True)
-    f = open(out_dir / f"out_{Path(__file__).stem}.txt", "w")
-    old = sys.stdout
-
-    class Tee:
-        def write(self, s):
-            old.write(s)
-            f.write(s)
-
-        def flush(self):
-            old.flush()
-            f.flush()
-
-    sys.stdout = Tee()
-    try:
-        yield
-    finally:
-        sys.stdout = old
-        f.close()
-
-
-def _create_client() -> Client:
-    base_url = os.getenv("VISGATE_BASE_URL", "https://visgateai.com/api/v1").strip()
-    return Client(base_url=base_url)
+from _common import create_client, tee_stdout
 
 
 def _assert(cond: bool, message: str) -> None:
@@ -49,8 +18,8 @@ def _assert(cond: bool, message: str) -> None:
 
 def main() -> None:
     suffix = str(int(time.time()))
-    with _tee_stdout():
-        with _create_client() as client:
+    with tee_stdout(__file__):
+        with create_client(byok=False) as client:
             print("check=managed_mode")
             managed = client.generate(
                 prompt=f"Istanbul skyline golden hour regression {suffix}",
@@ -118,7 +87,7 @@ def main() -> None:
                 prompt=f"Async image Istanbul sunset {suffix}",
                 wait=False,
             )
-            _assert(hasattr(async_img, "request_id"), "Async image should return request_id")
+            _assert(isinstance(async_img, GenerationRequest), "Async image should return request_id")
             img_result = async_img.wait(timeout=120, poll_interval=3)
             print(f"async_image_status={img_result.status}")
             print(f"async_image_output={img_result.output_url}")
@@ -132,7 +101,7 @@ def main() -> None:
                 skip_gcs_upload=True,
                 wait=False,
             )
-            _assert(hasattr(async_vid, "request_id"), "Async video should return request_id")
+            _assert(isinstance(async_vid, GenerationRequest), "Async video should return request_id")
             vid_result = async_vid.wait(timeout=300, poll_interval=4)
             print(f"async_video_status={vid_result.status}")
             print(f"async_video_output={vid_result.output_url}")
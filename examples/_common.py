@@ -0,0 +1,313 @@
+"""Shared helpers for the numbered example scripts (not part of the SDK)."""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import importlib.util
+import io
+import os
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence
+
+import httpx
+
+from visgate_sdk import AsyncClient, Client, ModelsResponse, ProviderBalancesResponse
+from visgate_sdk.client import DEFAULT_BASE_URL, DEFAULT_LIMITS
+
+# Where examples write logs and downloaded assets. Created once at import.
+OUT_DIR = (Path(__file__).parent / "sample_outputs").resolve()
+OUT_DIR.mkdir(exist_ok=True)
+
+# Environment variables checked for each provider's BYOK key, in priority order.
+_PROVIDER_ENV: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "fal": ("VISGATE_FAL_API_KEY", "FAL_KEY"),
+    "replicate": ("VISGATE_REPLICATE_API_KEY", "REPLICATE_API_KEY"),
+    "runway": ("VISGATE_RUNWAY_API_KEY", "RUNWAY_API_KEY"),
+})
+
+
+@functools.lru_cache(maxsize=None)
+def provider_key(provider: str) -> Optional[str]:
+    """BYOK key for ``provider`` from the environment (read once per process)."""
+    for var in _PROVIDER_ENV.get(provider, ()):
+        v = os.getenv(var)
+        if v and (v := v.strip()):
+            return v
+    return None
+
+
+# The log file is only read after the run, so let it batch writes into large blocks.
+TEE_BUFFER_SIZE = 64 * 1024
+
+
+class _Tee:
+    """Minimal stdout replacement that mirrors writes into a log file.
+
+    Writes are collected until a newline arrives, so a ``print`` (message, then
+    ``"\\n"``) reaches each underlying stream as a single write.
+    """
+
+    __slots__ = ("_old", "_f", "_buf")
+
+    def __init__(self, old, f) -> None:
+        self._old = old
+        self._f = f
+        self._buf: list[str] = []
+
+    def write(self, s: str) -> None:
+        self._buf.append(s)
+        if "\n" in s:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buf:
+            joined = "".join(self._buf)
+            self._buf.clear()
+            self._old.write(joined)
+            self._f.write(joined)
+
+    def flush(self) -> None:
+        self._drain()
+        self._old.flush()
+        self._f.flush()
+
+
+@contextmanager
+def _python_tee(path: Path) -> Iterator[None]:
+    """Portable fallback for :func:`tee_stdout`: swap ``sys.stdout`` for a :class:`_Tee`."""
+    old = sys.stdout
+    raw = open(path, "wb", buffering=TEE_BUFFER_SIZE)
+    # Closing the wrapper flushes it and closes ``raw`` as well.
+    with io.TextIOWrapper(raw, encoding="utf-8", write_through=False) as f:
+        tee = _Tee(old, f)
+        sys.stdout = tee
+        try:
+            yield
+        finally:
+            tee.flush()
+            sys.stdout = old
+
+
+def _stdout_fd() -> Optional[int]:
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+@contextmanager
+def _block_buffered_stdout() -> Iterator[None]:
+    """Off a terminal (CI logs, pipes) batch stdout writes instead of flushing every line.
+
+    Python already block-buffers a non-TTY stdout unless PYTHONUNBUFFERED or ``-u`` is set,
+    which is common in CI containers. The previous buffering mode is restored on exit, so
+    steps run later in the same process see the user's setting again.
+    """
+    stdout = sys.stdout
+    reconfigure = getattr(stdout, "reconfigure", None)
+    if reconfigure is None or stdout.isatty():
+        yield
+        return
+    previous = {"line_buffering": stdout.line_buffering, "write_through": stdout.write_through}
+    reconfigure(line_buffering=False, write_through=False)
+    try:
+        yield
+    finally:
+        reconfigure(**previous)
+
+
+@contextmanager
+def tee_stdout(script: str) -> Iterator[None]:
+    """Mirror stdout into ``sample_outputs/out_<script stem>.txt`` for the duration of the block.
+
+    Where a ``tee`` binary exists, fd 1 is pointed at a ``tee`` process, so ``print`` stays a
+    plain buffered write and the fan-out happens outside the interpreter. Otherwise (e.g. on
+    Windows, or when stdout has no file descriptor) ``sys.stdout`` is wrapped in Python.
+    Set ``VISGATE_NO_TEE=1`` to skip the log file entirely.
+    """
+    with _block_buffered_stdout():
+        if os.getenv("VISGATE_NO_TEE") == "1":
+            # The caller already captures stdout (e.g. CI logs), a second copy is only extra I/O
+            yield
+            return
+        path = OUT_DIR / f"out_{Path(script).stem}.txt"
+        tee_bin = shutil.which("tee")
+        fd = _stdout_fd()
+        if tee_bin is None or fd is None:
+            with _python_tee(path):
+                yield
+            return
+
+        sys.stdout.flush()
+        saved = os.dup(fd)
+        # Started before the dup2 below, so tee itself keeps writing to the original stdout.
+        proc = subprocess.Popen([tee_bin, str(path)], stdin=subprocess.PIPE)
+        os.dup2(proc.stdin.fileno(), fd)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            os.dup2(saved, fd)
+            os.close(saved)
+            proc.stdin.close()
+            proc.wait()
+
+
+def api_base_url() -> str:
+    return os.getenv("VISGATE_BASE_URL", DEFAULT_BASE_URL).strip()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """One connection pool for every client in the process.
+
+    Requests go through a single ``httpx.Client`` built like the SDK's own pool: HTTP/2
+    when h2 is installed, and the proxies from HTTPS_PROXY / NO_PROXY. ``close()`` is a
+    no-op so each example can still close its own client. The pool itself is closed at
+    interpreter exit.
+    """
+
+    def __init__(self) -> None:
+        http2 = importlib.util.find_spec("h2") is not None
+        self._client = httpx.Client(http2=http2, limits=DEFAULT_LIMITS)
+        atexit.register(self._client.close)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._client.send(request, stream=True)
+
+    def close(self) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_transport() -> _SharedTransport:
+    return _SharedTransport()
+
+
+def client_transport() -> Optional[httpx.BaseTransport]:
+    """Shared pool when VISGATE_SHARE_CLIENT=1 (set by the in-process runner), else None."""
+    return _shared_transport() if os.getenv("VISGATE_SHARE_CLIENT") == "1" else None
+
+
+def create_client(*, byok: bool = True) -> Client:
+    """Sync client for the examples, with every BYOK key found in the environment.
+
+    Pass ``byok=False`` for a managed-mode client that sends no provider keys.
+    """
+    if not byok:
+        return Client(base_url=api_base_url(), transport=client_transport())
+    return Client(
+        base_url=api_base_url(),
+        fal_key=provider_key("fal"),
+        replicate_key=provider_key("replicate"),
+        runway_key=provider_key("runway"),
+        transport=client_transport(),
+    )
+
+
+def create_async_client(**provider_keys: str) -> AsyncClient:
+    """Async client for the examples that sends only the given BYOK keys, e.g. ``fal_key``."""
+    return AsyncClient(base_url=api_base_url(), **provider_keys)
+
+
+def report_results(
+    names: Sequence[str], results: Sequence[Any], kind: str
+) -> list[BaseException]:
+    """Print the lines of each provider run, or an error line for a run that failed.
+
+    ``results`` comes from ``asyncio.gather(..., return_exceptions=True)``. The failures
+    are returned so the caller can still fail the script once everything is reported.
+    """
+    failures: list[BaseException] = []
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            print(f"{name}_{kind}_error={result!r}")
+            failures.append(result)
+        else:
+            for line in result:
+                print(line)
+    return failures
+
+
+# Catalog-style responses barely change within a run, so examples that are chained
+# in one process (or re-run back to back) share a short-lived copy.
+CACHE_TTL = 30.0
+_cache: dict[tuple, tuple[float, Any]] = {}
+
+
+def _ttl_cached(key: tuple, fetch: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    hit = _cache.get(key)
+    if hit is not None and now - hit[0] < CACHE_TTL:
+        return hit[1]
+    value = fetch()
+    _cache[key] = (now, value)
+    return value
+
+
+def list_models(client: Client, **query: Any) -> ModelsResponse:
+    """``client.models.list(**query)``, reused for :data:`CACHE_TTL` seconds per account."""
+    key = (client.base_url, client.api_key, "models.list", tuple(sorted(query.items())))
+    return _ttl_cached(key, lambda: client.models.list(**query))
+
+
+def provider_balances(client: Client, *, byok: bool = True) -> ProviderBalancesResponse:
+    """``client.providers.balances()``, reused for :data:`CACHE_TTL` seconds per account.
+
+    Pass the same ``byok`` as to :func:`create_client`. The BYOK keys it sent are part of
+    the cache key because they decide which balances come back.
+    """
+    providers = ("fal", "replicate", "runway")
+    keys = tuple(provider_key(p) for p in providers) if byok else ()
+    key = (client.base_url, client.api_key, "providers.balances", keys)
+    return _ttl_cached(key, client.providers.balances)
+
+
+# One pooled client per run so every asset download reuses keep-alive connections
+# instead of paying a fresh TCP + TLS handshake per file.
+DOWNLOAD_LIMITS = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=15.0)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def download_client(timeout: float = 120.0) -> httpx.Client:
+    """Create the httpx client used for asset downloads. Use as a context manager."""
+    return httpx.Client(follow_redirects=True, timeout=timeout, limits=DOWNLOAD_LIMITS)
+
+
+def async_download_client(timeout: float = 120.0) -> httpx.AsyncClient:
+    """Async counterpart of :func:`download_client` for examples that fan out with asyncio."""
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=16, keepalive_expiry=15.0),
+    )
+
+
+def download(dl: httpx.Client, url: str, path: Path) -> None:
+    """Stream ``url`` to ``path`` in fixed-size chunks (peak memory stays at one chunk)."""
+    with dl.stream("GET", url) as r:
+        r.raise_for_status()
+        with open(path, "wb") as f:
+            for chunk in r.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+
+async def async_download(dl: httpx.AsyncClient, url: str, path: Path) -> None:
+    """Async counterpart of :func:`download`.
+
+    File I/O runs in a worker thread so concurrent downloads never stall the event loop.
+    """
+    async with dl.stream("GET", url) as r:
+        r.raise_for_status()
+        f = await asyncio.to_thread(open, path, "wb")
+        try:
+            async for chunk in r.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
@@ -2,11 +2,17 @@
 Run all SDK capability examples in order. All examples are tested against the live API.
 Default: https://visgateai.com/api/v1 (override with VISGATE_BASE_URL).
 VISGATE_API_KEY is required for auth-dependent steps.
+
+Scripts run in this interpreter via runpy, so imports and keep-alive connections are shared
+across steps. Pass --isolated to run each script in its own subprocess instead.
 """
 from __future__ import annotations
 
+import os
+import runpy
 import subprocess
 import sys
+import traceback
 from pathlib import Path
 
 
@@ -31,15 +37,43 @@ SCRIPTS = [
 ]
 
 
+def _run_in_process(script_path: Path) -> bool:
+    """Run ``script_path`` as ``__main__`` in this interpreter. Returns True on success."""
+    saved_argv = sys.argv
+    sys.argv = [str(script_path)]
+    try:
+        runpy.run_path(str(script_path), run_name="__main__")
+    except SystemExit as exc:
+        return exc.code in (None, 0)
+    except Exception:
+        traceback.print_exc()
+        return False
+    finally:
+        sys.argv = saved_argv
+    return True
+
+
+def _run_isolated(script_path: Path) -> bool:
+    return subprocess.run([sys.executable, str(script_path)], check=False).returncode == 0
+
+
 def main() -> None:
     base_dir = Path(__file__).parent
+    if "--isolated" in sys.argv[1:]:
+        run = _run_isolated
+    else:
+        run = _run_in_process
+        # Steps share this interpreter, so let their clients share one connection pool too
+        os.environ.setdefault("VISGATE_SHARE_CLIENT", "1")
+    if os.getenv("CI"):
+        # CI already keeps the job log, so skip the per-script sample_outputs copies
+        os.environ.setdefault("VISGATE_NO_TEE", "1")
     failed = False
 
     for script in SCRIPTS:
         script_path = base_dir / script
         print(f"\n=== RUN {script} ===")
-        completed = subprocess.run([sys.executable, str(script_path)], check=False)
-        if completed.returncode != 0:
+        if not run(script_path):
             failed = True
             print(f"step_failed={script}")
             break
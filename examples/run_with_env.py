@@ -7,31 +7,25 @@ Usage:
 from __future__ import annotations
 
 import os
+import re
 import sys
 from pathlib import Path
 
 
+# KEY=VALUE per line, ignoring blank lines and "#" comments. Whitespace around the key and
+# value is dropped. [^\S\n] is whitespace other than a newline, so a match never spans lines.
+_ENV_LINE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+
 def _load_env_file(path: Path) -> None:
     if not path.is_file():
         print(f"Env file not found: {path}", file=sys.stderr)
         sys.exit(1)
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if key:
-                if len(value) >= 2 and (
-                    (value.startswith('"') and value.endswith('"'))
-                    or (value.startswith("'") and value.endswith("'"))
-                ):
-                    value = value[1:-1]
-                os.environ[key] = value
+    data = path.read_text(encoding="utf-8")
+    for key, value in _ENV_LINE.findall(data):
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        os.environ[key] = value
 
 
 def main() -> None:
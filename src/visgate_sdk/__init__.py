@@ -1,6 +1,7 @@
 """visgate Python SDK — unified client for the visgate vision ai gateway."""
 from __future__ import annotations
 
+from visgate_sdk._version import __version__
 from visgate_sdk.client import AsyncClient, Client
 from visgate_sdk.exceptions import (
     AuthenticationError,
@@ -21,17 +22,14 @@ from visgate_sdk.resources.providers import (
     ProviderKeysResponse,
     ProviderValidationResult,
 )
-from visgate_sdk.resources.requests import RequestStatusResult
+from visgate_sdk.resources.requests import (
+    AsyncGenerationRequest,
+    GenerationRequest,
+    RequestStatusResult,
+)
 from visgate_sdk.resources.usage import UsageSummary
 from visgate_sdk.resources.videos import VideoResult
 
-try:
-    from importlib.metadata import version as _pkg_version
-
-    __version__ = _pkg_version("visgate-sdk")
-except Exception:
-    __version__ = "0.0.0-dev"
-
 __all__ = [
     # Clients
     "Client",
@@ -45,6 +43,9 @@ __all__ = [
     "FeaturedSection",
     "UsageSummary",
     "RequestStatusResult",
+    # Pending async (202) generation handles
+    "GenerationRequest",
+    "AsyncGenerationRequest",
     # Provider types
     "ProviderBalanceItem",
     "ProviderBalancesResponse",
@@ -0,0 +1,16 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from orjson import dumps, loads
+except ImportError:  # orjson is optional: pip install visgate-sdk[fast]
+    import json
+    from json import loads
+
+    def dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        """Compact UTF-8 JSON, the same bytes layout as ``orjson.dumps``."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+__all__ = ["dumps", "loads"]
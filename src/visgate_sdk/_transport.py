@@ -0,0 +1,181 @@
+"""httpx transports that retry transient failures (429, 5xx, timeouts, connect errors)."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Callable, Dict, Optional, TypeVar
+from urllib.request import getproxies
+
+import httpx
+
+from visgate_sdk.exceptions import RETRY_AFTER_HEADER
+
+logger = logging.getLogger("visgate_sdk")
+
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_T = TypeVar("_T", httpx.BaseTransport, httpx.AsyncBaseTransport)
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Wrap a transport and retry transient failures with backoff.
+
+    Retryable responses are closed before the next attempt so their connection goes back
+    to the pool. Once retries are exhausted the last response (or exception) is passed on.
+    With ``total_timeout`` set, a server-requested wait (429/5xx with ``Retry-After``) that
+    would end past that budget (measured from the first attempt) is not slept: the response
+    is passed on straight away. Timeouts and connect errors are always retried with the
+    short backoff, since a timed-out attempt alone can use up the whole budget.
+    """
+
+    def __init__(
+        self,
+        wrapped: httpx.BaseTransport,
+        max_retries: int,
+        total_timeout: Optional[float] = None,
+    ) -> None:
+        self._wrapped = wrapped
+        self._max_retries = max_retries
+        self._total_timeout = total_timeout
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        retryable = _RETRYABLE_STATUS_CODES
+        deadline = _deadline(self._total_timeout)
+        for attempt in range(self._max_retries + 1):
+            logger.debug("%s %s (attempt %d)", request.method, request.url.path, attempt + 1)
+            try:
+                response = self._wrapped.handle_request(request)
+            except (httpx.TimeoutException, httpx.ConnectError) as exc:
+                if attempt >= self._max_retries:
+                    raise
+                wait = _backoff(attempt)
+                logger.info("%s, retrying in %.1fs", type(exc).__name__, wait)
+                time.sleep(wait)
+                continue
+
+            if response.status_code in retryable and attempt < self._max_retries:
+                wait = _retry_wait(response, attempt)
+                if not _fits(deadline, wait):
+                    logger.info("Retry wait %.1fs exceeds the request budget", wait)
+                    return response
+                logger.info("Retryable %d, waiting %.1fs", response.status_code, wait)
+                response.close()
+                time.sleep(wait)
+                continue
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        self._wrapped.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`RetryTransport`."""
+
+    def __init__(
+        self,
+        wrapped: httpx.AsyncBaseTransport,
+        max_retries: int,
+        total_timeout: Optional[float] = None,
+    ) -> None:
+        self._wrapped = wrapped
+        self._max_retries = max_retries
+        self._total_timeout = total_timeout
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        retryable = _RETRYABLE_STATUS_CODES
+        deadline = _deadline(self._total_timeout)
+        for attempt in range(self._max_retries + 1):
+            logger.debug("%s %s (attempt %d)", request.method, request.url.path, attempt + 1)
+            try:
+                response = await self._wrapped.handle_async_request(request)
+            except (httpx.TimeoutException, httpx.ConnectError) as exc:
+                if attempt >= self._max_retries:
+                    raise
+                wait = _backoff(attempt)
+                logger.info("%s, retrying in %.1fs", type(exc).__name__, wait)
+                await asyncio.sleep(wait)
+                continue
+
+            if response.status_code in retryable and attempt < self._max_retries:
+                wait = _retry_wait(response, attempt)
+                if not _fits(deadline, wait):
+                    logger.info("Retry wait %.1fs exceeds the request budget", wait)
+                    return response
+                logger.info("Retryable %d, waiting %.1fs", response.status_code, wait)
+                await response.aclose()
+                await asyncio.sleep(wait)
+                continue
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
+
+
+def _environment_proxies() -> Dict[str, Optional[str]]:
+    """Mount pattern to proxy URL (None = direct) from HTTP(S)_PROXY, ALL_PROXY, NO_PROXY.
+
+    Mirrors ``get_environment_proxies`` from httpx 0.28 (a private helper there), so a
+    client with its own transport routes requests like a default ``httpx.Client``.
+    """
+    info = getproxies()
+    mounts: Dict[str, Optional[str]] = {
+        f"{scheme}://": url if "://" in url else f"http://{url}"
+        for scheme, url in ((s, info.get(s)) for s in ("http", "https", "all"))
+        if url
+    }
+    for host in filter(None, (h.strip() for h in info.get("no", "").split(","))):
+        if host == "*":
+            return {}
+        if "://" in host:
+            mounts[host] = None
+        elif ":" in host:  # IPv6 literal
+            mounts[f"all://[{host}]"] = None
+        elif host.lower() == "localhost" or host.replace(".", "").isdigit():
+            mounts[f"all://{host}"] = None
+        else:
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+def proxy_mounts(make_transport: Callable[[Optional[httpx.Proxy]], _T]) -> Dict[str, Optional[_T]]:
+    """Mounts for the proxies configured in the environment (HTTPS_PROXY, NO_PROXY, ...).
+
+    httpx skips environment proxies when a custom transport is passed, so the clients
+    rebuild them here with ``make_transport`` to keep the usual behaviour.
+    """
+    return {
+        pattern: make_transport(httpx.Proxy(url)) if url else None
+        for pattern, url in _environment_proxies().items()
+    }
+
+
+def _deadline(budget: Optional[float]) -> Optional[float]:
+    return None if budget is None else time.monotonic() + budget
+
+
+def _fits(deadline: Optional[float], wait: float) -> bool:
+    """Whether sleeping ``wait`` seconds still ends before ``deadline``."""
+    return deadline is None or time.monotonic() + wait <= deadline
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff (0.5s, 1s, 2s, ... capped at 8s) with +/-50% jitter.
+
+    The jitter spreads out retries from many clients that failed at the same moment.
+    """
+    return min(0.5 * (2**attempt), 8.0) * random.uniform(0.5, 1.5)
+
+
+def _retry_wait(response: httpx.Response, attempt: int) -> float:
+    """Use Retry-After header if present, otherwise exponential backoff."""
+    retry_after = response.headers.get(RETRY_AFTER_HEADER)
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return _backoff(attempt)
@@ -1,12 +1,34 @@
 """Internal utilities."""
 from __future__ import annotations
 
+import functools
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
+# ``@dataclass(**DATACLASS_SLOTS)`` drops the per-instance __dict__ on Python 3.10+.
+# 3.9 has no ``slots=`` argument, so the response classes keep a plain __dict__ there.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-def parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    """Parse ISO 8601 datetime string, handling Z suffix for Python 3.9+."""
-    if not value:
-        return None
-    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+# Results from one batch or catalog page often share timestamps, and datetimes are immutable,
+# so parsed values are memoized.
+if sys.version_info >= (3, 11):
+
+    @functools.lru_cache(maxsize=1024)
+    def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+        """Parse ISO 8601 datetime string (3.11+ accepts the Z suffix natively)."""
+        if not value:
+            return None
+        return datetime.fromisoformat(value)
+
+else:
+
+    @functools.lru_cache(maxsize=1024)
+    def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+        """Parse ISO 8601 datetime string, handling Z suffix for Python 3.9+."""
+        if not value:
+            return None
+        if value[-1] == "Z":
+            # Only the trailing designator needs rewriting, no need to scan the whole string
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
@@ -0,0 +1,14 @@
+"""Package version, resolved once at import."""
+from __future__ import annotations
+
+
+def _get_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("visgate-sdk")
+    except Exception:
+        return "0.0.0-dev"
+
+
+__version__ = _get_version()
@@ -1,14 +1,19 @@
 """visgate API client (sync and async)."""
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
-import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
+from visgate_sdk._json import dumps, loads
+from visgate_sdk._transport import AsyncRetryTransport, RetryTransport, proxy_mounts
+from visgate_sdk._version import __version__
 from visgate_sdk.exceptions import (
+    RETRY_AFTER_HEADER,
+    STATUS_TO_EXC,
     AuthenticationError,
     ConnectionError,
     ProviderError,
@@ -17,6 +22,13 @@ from visgate_sdk.exceptions import (
     ValidationError,
     VisgateError,
 )
+from visgate_sdk.resources.generate import AsyncGenerate, Generate
+from visgate_sdk.resources.images import AsyncImages, Images
+from visgate_sdk.resources.models import AsyncModels, Models
+from visgate_sdk.resources.providers import AsyncProviders, Providers
+from visgate_sdk.resources.requests import AsyncRequests, Requests
+from visgate_sdk.resources.usage import AsyncUsage, Usage
+from visgate_sdk.resources.videos import AsyncVideos, Videos
 
 logger = logging.getLogger("visgate_sdk")
 
@@ -24,19 +36,14 @@ DEFAULT_BASE_URL = "https://visgateai.com/api/v1"
 DEFAULT_TIMEOUT = 120.0
 DEFAULT_MAX_RETRIES = 2
 
-_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
-
-
-def _get_version() -> str:
-    try:
-        from importlib.metadata import version
-
-        return version("visgate-sdk")
-    except Exception:
-        return "0.0.0-dev"
-
+# Every request goes to one host, so a modest pool kept warm between polls is enough
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=128, max_keepalive_connections=32, keepalive_expiry=60.0
+)
 
-_VERSION = _get_version()
+# HTTP/2 multiplexes concurrent calls over one connection. Used when ``h2`` is installed
+# (pip install visgate-sdk[http2]), plain HTTP/1.1 otherwise.
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
 
 def _resolve_api_key(api_key: Optional[str]) -> str:
@@ -55,13 +62,15 @@ def _build_headers(
     fal_key: Optional[str] = None,
     replicate_key: Optional[str] = None,
     runway_key: Optional[str] = None,
-) -> Dict[str, str]:
-    """Build default request headers."""
-    headers: Dict[str, str] = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "User-Agent": f"visgate-sdk-python/{_VERSION}",
-    }
+) -> httpx.Headers:
+    """Build default request headers (set once on the httpx client, not per request)."""
+    headers = httpx.Headers(
+        {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": f"visgate-sdk-python/{__version__}",
+        }
+    )
     if fal_key:
         headers["X-Fal-Key"] = fal_key
     if replicate_key:
@@ -76,41 +85,42 @@ def _handle_response(response: httpx.Response) -> Any:
     status = response.status_code
 
     if status < 400:
-        return response.json()
+        # 204 and 304 carry no body
+        return loads(response.content) if response.content else None
 
-    if status == 401:
+    exc_class = STATUS_TO_EXC.get(status)
+    if exc_class is AuthenticationError:
         raise AuthenticationError("Invalid or missing API key")
 
-    if status == 422:
-        try:
-            data = response.json()
-            message = data.get("message", response.text)
-            field = data.get("details", {}).get("field")
-        except Exception:
-            message = response.text
-            field = None
-        raise ValidationError(message, field=field)
-
-    if status == 429:
-        retry_after = response.headers.get("Retry-After")
+    if exc_class is RateLimitError:
+        retry_after = response.headers.get(RETRY_AFTER_HEADER)
         raise RateLimitError(
             "Rate limit exceeded",
             retry_after=int(retry_after) if retry_after else None,
         )
 
-    # All other errors
+    # Parse the error body once, every branch below reads from it
     try:
-        data = response.json()
+        data = loads(response.content)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
         error_code = data.get("error", "UNKNOWN_ERROR")
-        message = data.get("message", response.text)
-    except Exception:
+        # response.text is only decoded when the body has no message of its own
+        message = data["message"] if "message" in data else response.text
+        details = data.get("details")
+        if not isinstance(details, dict):
+            details = {}
+    else:
         error_code = f"HTTP_{status}"
         message = response.text
-        data = {}
+        details = {}
+
+    if exc_class is ValidationError:
+        raise ValidationError(message, field=details.get("field"))
 
     if "PROVIDER" in error_code:
-        provider = data.get("details", {}).get("provider", "unknown")
-        raise ProviderError(message, provider=provider)
+        raise ProviderError(message, provider=details.get("provider", "unknown"))
 
     raise VisgateError(message, error_code=error_code, status_code=status)
 
@@ -122,12 +132,16 @@ class Client:
         api_key: visgate API key (``vg-...``). If not provided, reads from
             the ``VISGATE_API_KEY`` environment variable.
         base_url: API base URL. Defaults to ``https://visgateai.com/api/v1``.
-        timeout: Request timeout in seconds. Defaults to 120.
+        timeout: Request timeout in seconds. Defaults to 120. Retry waits never run past
+            this budget either.
         max_retries: Number of automatic retries for transient errors (429, 5xx).
             Defaults to 2. Set to 0 to disable.
         fal_key: Optional Fal.ai API key for BYOK mode.
         replicate_key: Optional Replicate API key for BYOK mode.
         runway_key: Optional Runway API key for BYOK mode.
+        transport: Optional ``httpx.BaseTransport`` to send requests through instead of the
+            default pool, e.g. one connection pool shared by several clients, or
+            ``httpx.MockTransport`` in tests. Retries still apply on top of it.
 
     Usage::
 
@@ -154,14 +168,26 @@ class Client:
         fal_key: Optional[str] = None,
         replicate_key: Optional[str] = None,
         runway_key: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         self.api_key = _resolve_api_key(api_key)
         self.base_url = base_url.rstrip("/")
+        self._repr = f"Client(base_url={self.base_url!r})"
+        self.timeout = timeout
         self.max_retries = max_retries
         self._fal_key = fal_key
         self._replicate_key = replicate_key
         self._runway_key = runway_key
 
+        def pooled(proxy: Optional[httpx.Proxy] = None) -> RetryTransport:
+            inner = httpx.HTTPTransport(http2=_HTTP2, limits=DEFAULT_LIMITS, proxy=proxy)
+            return RetryTransport(inner, max_retries, timeout)
+
+        if transport is None:
+            base, mounts = pooled(), proxy_mounts(pooled)
+        else:
+            base, mounts = RetryTransport(transport, max_retries, timeout), None
+
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=httpx.Timeout(timeout),
@@ -171,17 +197,11 @@ class Client:
                 replicate_key=replicate_key,
                 runway_key=runway_key,
             ),
+            transport=base,
+            mounts=mounts,
         )
 
         # Resources
-        from visgate_sdk.resources.generate import Generate
-        from visgate_sdk.resources.images import Images
-        from visgate_sdk.resources.models import Models
-        from visgate_sdk.resources.providers import Providers
-        from visgate_sdk.resources.requests import Requests
-        from visgate_sdk.resources.usage import Usage
-        from visgate_sdk.resources.videos import Videos
-
         self.images = Images(self)
         self.models = Models(self)
         self.videos = Videos(self)
@@ -222,18 +242,17 @@ class Client:
         self._fal_key = fal_key or None
         self._replicate_key = replicate_key or None
         self._runway_key = runway_key or None
-        # Rebuild the underlying httpx client with new headers
-        self._client.close()
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
-            headers=_build_headers(
-                self.api_key,
-                fal_key=self._fal_key,
-                replicate_key=self._replicate_key,
-                runway_key=self._runway_key,
-            ),
-        )
+        # Swap the headers in place so the connection pool (and its TLS sessions) survives
+        headers = self._client.headers
+        for name, value in (
+            ("X-Fal-Key", self._fal_key),
+            ("X-Replicate-Key", self._replicate_key),
+            ("X-Runway-Key", self._runway_key),
+        ):
+            if value:
+                headers[name] = value
+            else:
+                headers.pop(name, None)
 
     def health(self) -> Dict[str, Any]:
         """Check API health status.
@@ -244,42 +263,25 @@ class Client:
         return self._request("GET", "/health")
 
     def _request(self, method: str, path: str, **kwargs: Any) -> Any:
-        """Send an HTTP request with automatic retry on transient errors."""
-        last_exc: Optional[Exception] = None
-
-        for attempt in range(1 + self.max_retries):
-            try:
-                logger.debug("%s %s (attempt %d)", method, path, attempt + 1)
-                response = self._client.request(method, path, **kwargs)
-
-                if response.status_code in _RETRYABLE_STATUS_CODES and attempt < self.max_retries:
-                    wait = _retry_wait(response, attempt)
-                    logger.info("Retryable %d, waiting %.1fs", response.status_code, wait)
-                    time.sleep(wait)
-                    continue
-
-                return _handle_response(response)
-
-            except httpx.TimeoutException as exc:
-                last_exc = exc
-                if attempt < self.max_retries:
-                    wait = _backoff(attempt)
-                    logger.info("Timeout, retrying in %.1fs", wait)
-                    time.sleep(wait)
-                    continue
-                raise TimeoutError(f"Request timed out after {attempt + 1} attempt(s)") from exc
-
-            except httpx.ConnectError as exc:
-                last_exc = exc
-                if attempt < self.max_retries:
-                    wait = _backoff(attempt)
-                    logger.info("Connection error, retrying in %.1fs", wait)
-                    time.sleep(wait)
-                    continue
-                raise ConnectionError(f"Connection failed: {exc}") from exc
-
-        # Should not reach here, but just in case
-        raise VisgateError(f"Request failed after {self.max_retries + 1} attempts") from last_exc
+        """Send an HTTP request and return the parsed body."""
+        return self._send(method, path, **kwargs)[1]
+
+    def _send(self, method: str, path: str, **kwargs: Any) -> Tuple[httpx.Response, Any]:
+        """Send an HTTP request and return ``(response, parsed body)``.
+
+        Transient errors are retried by the transport.
+        """
+        if "json" in kwargs:
+            # Encoded here (orjson when installed), Content-Type is already a default header
+            kwargs["content"] = dumps(kwargs.pop("json"))
+        try:
+            response = self._client.request(method, path, **kwargs)
+        except httpx.TimeoutException as exc:
+            # The transport may stop retrying early, so no attempt count is claimed here
+            raise TimeoutError("Request timed out") from exc
+        except httpx.ConnectError as exc:
+            raise ConnectionError(f"Connection failed: {exc}") from exc
+        return response, _handle_response(response)
 
     def close(self) -> None:
         """Close the underlying HTTP connection pool."""
@@ -292,7 +294,7 @@ class Client:
         self.close()
 
     def __repr__(self) -> str:
-        return f"Client(base_url={self.base_url!r})"
+        return self._repr
 
 
 class AsyncClient:
@@ -315,11 +317,23 @@ class AsyncClient:
         fal_key: Optional[str] = None,
         replicate_key: Optional[str] = None,
         runway_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self.api_key = _resolve_api_key(api_key)
         self.base_url = base_url.rstrip("/")
+        self._repr = f"AsyncClient(base_url={self.base_url!r})"
+        self.timeout = timeout
         self.max_retries = max_retries
 
+        def pooled(proxy: Optional[httpx.Proxy] = None) -> AsyncRetryTransport:
+            inner = httpx.AsyncHTTPTransport(http2=_HTTP2, limits=DEFAULT_LIMITS, proxy=proxy)
+            return AsyncRetryTransport(inner, max_retries, timeout)
+
+        if transport is None:
+            base, mounts = pooled(), proxy_mounts(pooled)
+        else:
+            base, mounts = AsyncRetryTransport(transport, max_retries, timeout), None
+
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=httpx.Timeout(timeout),
@@ -329,17 +343,11 @@ class AsyncClient:
                 replicate_key=replicate_key,
                 runway_key=runway_key,
             ),
+            transport=base,
+            mounts=mounts,
         )
 
         # Resources
-        from visgate_sdk.resources.generate import AsyncGenerate
-        from visgate_sdk.resources.images import AsyncImages
-        from visgate_sdk.resources.models import AsyncModels
-        from visgate_sdk.resources.providers import AsyncProviders
-        from visgate_sdk.resources.requests import AsyncRequests
-        from visgate_sdk.resources.usage import AsyncUsage
-        from visgate_sdk.resources.videos import AsyncVideos
-
         self.images = AsyncImages(self)
         self.models = AsyncModels(self)
         self.videos = AsyncVideos(self)
@@ -362,43 +370,24 @@ class AsyncClient:
         return await self._request("GET", "/health")
 
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
-        """Send an HTTP request with automatic retry on transient errors."""
-        import asyncio
-
-        last_exc: Optional[Exception] = None
-
-        for attempt in range(1 + self.max_retries):
-            try:
-                logger.debug("%s %s (attempt %d)", method, path, attempt + 1)
-                response = await self._client.request(method, path, **kwargs)
-
-                if response.status_code in _RETRYABLE_STATUS_CODES and attempt < self.max_retries:
-                    wait = _retry_wait(response, attempt)
-                    logger.info("Retryable %d, waiting %.1fs", response.status_code, wait)
-                    await asyncio.sleep(wait)
-                    continue
-
-                return _handle_response(response)
-
-            except httpx.TimeoutException as exc:
-                last_exc = exc
-                if attempt < self.max_retries:
-                    wait = _backoff(attempt)
-                    logger.info("Timeout, retrying in %.1fs", wait)
-                    await asyncio.sleep(wait)
-                    continue
-                raise TimeoutError(f"Request timed out after {attempt + 1} attempt(s)") from exc
-
-            except httpx.ConnectError as exc:
-                last_exc = exc
-                if attempt < self.max_retries:
-                    wait = _backoff(attempt)
-                    logger.info("Connection error, retrying in %.1fs", wait)
-                    await asyncio.sleep(wait)
-                    continue
-                raise ConnectionError(f"Connection failed: {exc}") from exc
-
-        raise VisgateError(f"Request failed after {self.max_retries + 1} attempts") from last_exc
+        """Send an HTTP request and return the parsed body."""
+        return (await self._send(method, path, **kwargs))[1]
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> Tuple[httpx.Response, Any]:
+        """Send an HTTP request and return ``(response, parsed body)``.
+
+        Transient errors are retried by the transport.
+        """
+        if "json" in kwargs:
+            kwargs["content"] = dumps(kwargs.pop("json"))
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.TimeoutException as exc:
+            # The transport may stop retrying early, so no attempt count is claimed here
+            raise TimeoutError("Request timed out") from exc
+        except httpx.ConnectError as exc:
+            raise ConnectionError(f"Connection failed: {exc}") from exc
+        return response, _handle_response(response)
 
     async def close(self) -> None:
         """Close the underlying HTTP connection pool."""
@@ -411,24 +400,4 @@ class AsyncClient:
         await self.close()
 
     def __repr__(self) -> str:
-        return f"AsyncClient(base_url={self.base_url!r})"
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _backoff(attempt: int) -> float:
-    """Exponential backoff: 0.5s, 1s, 2s, ..."""
-    return min(0.5 * (2**attempt), 8.0)
-
-
-def _retry_wait(response: httpx.Response, attempt: int) -> float:
-    """Use Retry-After header if present, otherwise exponential backoff."""
-    retry_after = response.headers.get("Retry-After")
-    if retry_after:
-        try:
-            return float(retry_after)
-        except ValueError:
-            pass
-    return _backoff(attempt)
+        return self._repr
@@ -1,7 +1,7 @@
 """visgate SDK exceptions. All extend VisgateError."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
 
 
 class VisgateError(Exception):
@@ -91,3 +91,15 @@ class ConnectionError(VisgateError):
 
     def __init__(self, message: str = "Connection failed"):
         super().__init__(message, "CONNECTION_ERROR")
+
+
+# Header a 429 (or 503) uses to say how many seconds to wait before retrying.
+RETRY_AFTER_HEADER = "Retry-After"
+
+# Status codes with a dedicated exception class. Other 4xx/5xx responses raise
+# ProviderError or VisgateError depending on the error code in the body.
+STATUS_TO_EXC: Dict[int, Type[VisgateError]] = {
+    401: AuthenticationError,
+    422: ValidationError,
+    429: RateLimitError,
+}
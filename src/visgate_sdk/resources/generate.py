@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from visgate_sdk._utils import parse_datetime
+from visgate_sdk._utils import DATACLASS_SLOTS, parse_datetime
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from visgate_sdk.client import AsyncClient, Client
 
 
-@dataclass
+@dataclass(repr=False, **DATACLASS_SLOTS)
 class GenerateResult:
     """Result of a generation request.
 
@@ -44,18 +44,19 @@ class GenerateResult:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> GenerateResult:
+        get = data.get
         return cls(
             id=data["id"],
-            image_url=data.get("image_url"),
-            images=data.get("images", []),
+            image_url=get("image_url"),
+            images=get("images") or [],
             model=data["model"],
-            provider=data.get("provider", ""),
-            mode=data.get("mode", ""),
-            cost=data.get("estimated_cost_usd", 0.0),
-            cost_per_megapixel=data.get("cost_per_megapixel_usd", 0.0),
-            latency_ms=data.get("latency_ms", 0),
-            resolution=data.get("resolution", {}),
-            created_at=parse_datetime(data.get("created_at")),
+            provider=get("provider", ""),
+            mode=get("mode", ""),
+            cost=get("estimated_cost_usd", 0.0),
+            cost_per_megapixel=get("cost_per_megapixel_usd", 0.0),
+            latency_ms=get("latency_ms", 0),
+            resolution=get("resolution") or {},
+            created_at=parse_datetime(get("created_at")),
         )
 
     def __repr__(self) -> str:
@@ -65,6 +66,15 @@ class GenerateResult:
         )
 
 
+def _generate_payload(
+    *, prompt: str, model: str, params: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Body for ``POST /generate`` (shared by sync and async)."""
+    if params:
+        return {"prompt": prompt, "model": model, "params": params}
+    return {"prompt": prompt, "model": model}
+
+
 class Generate:
     """Sync unified generation resource."""
 
@@ -77,9 +87,7 @@ class Generate:
         model: str = "fal-ai/flux/schnell",
         params: Optional[Dict[str, Any]] = None,
     ) -> GenerateResult:
-        payload: Dict[str, Any] = {"prompt": prompt, "model": model}
-        if params:
-            payload["params"] = params
+        payload = _generate_payload(prompt=prompt, model=model, params=params)
         data = self._client._request("POST", "/generate", json=payload)
         return GenerateResult.from_dict(data)
 
@@ -96,8 +104,6 @@ class AsyncGenerate:
         model: str = "fal-ai/flux/schnell",
         params: Optional[Dict[str, Any]] = None,
     ) -> GenerateResult:
-        payload: Dict[str, Any] = {"prompt": prompt, "model": model}
-        if params:
-            payload["params"] = params
+        payload = _generate_payload(prompt=prompt, model=model, params=params)
         data = await self._client._request("POST", "/generate", json=payload)
         return GenerateResult.from_dict(data)
@@ -1,19 +1,64 @@
 """Image generation: ``POST /images/generate``."""
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
-from visgate_sdk._utils import parse_datetime
-from visgate_sdk.resources.requests import AsyncGenerationRequest, GenerationRequest
+from visgate_sdk._utils import DATACLASS_SLOTS, parse_datetime
+from visgate_sdk.resources.requests import (
+    PREFER_ASYNC,
+    AsyncGenerationRequest,
+    GenerationRequest,
+    _is_pending,
+)
 
 if TYPE_CHECKING:
     from datetime import datetime
 
     from visgate_sdk.client import AsyncClient, Client
 
+_INCLUDE_STEPS: Dict[str, str] = {"include_steps": "true"}
 
-@dataclass
+
+def _image_request_kwargs(
+    *,
+    model: str,
+    prompt: str,
+    negative_prompt: Optional[str],
+    width: int,
+    height: int,
+    num_images: int,
+    seed: Optional[int],
+    params: Optional[Dict[str, Any]],
+    include_steps: bool,
+    wait: bool,
+) -> Dict[str, Any]:
+    """``_send`` keyword arguments for ``POST /images/generate`` (shared by sync and async)."""
+    payload: Dict[str, Any] = {
+        "model": model,
+        "prompt": prompt,
+        "width": width,
+        "height": height,
+        "num_images": num_images,
+    }
+    if negative_prompt:
+        payload["negative_prompt"] = negative_prompt
+    if seed is not None:
+        payload["seed"] = seed
+    if params:
+        payload.update(params)
+
+    kwargs: Dict[str, Any] = {"json": payload}
+    if include_steps:
+        kwargs["params"] = _INCLUDE_STEPS
+    if not wait:
+        kwargs["headers"] = PREFER_ASYNC
+    return kwargs
+
+
+@dataclass(repr=False, **DATACLASS_SLOTS)
 class ImageResult:
     """Result of an image generation request.
 
@@ -47,19 +92,20 @@ class ImageResult:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> ImageResult:
+        get = data.get
         return cls(
             id=data["id"],
-            images=data.get("images", []),
+            images=get("images") or [],
             model=data["model"],
             provider=data["provider"],
-            cost=data.get("cost", 0.0),
-            cache_hit=data.get("cache_hit", False),
-            provider_cost_avoided_micro=data.get("provider_cost_avoided_micro"),
-            latency_ms=data.get("latency_ms"),
-            created_at=parse_datetime(data.get("created_at")),
-            output_storage=data.get("output_storage"),
-            output_size_bytes=data.get("output_size_bytes"),
-            steps=data.get("steps"),
+            cost=get("cost", 0.0),
+            cache_hit=get("cache_hit", False),
+            provider_cost_avoided_micro=get("provider_cost_avoided_micro"),
+            latency_ms=get("latency_ms"),
+            created_at=parse_datetime(get("created_at")),
+            output_storage=get("output_storage"),
+            output_size_bytes=get("output_size_bytes"),
+            steps=get("steps"),
         )
 
     def __repr__(self) -> str:
@@ -107,31 +153,52 @@ class Images:
         Returns:
             ImageResult when wait=True, or GenerationRequest when wait=False.
         """
-        payload: Dict[str, Any] = {
-            "model": model,
-            "prompt": prompt,
-            "width": width,
-            "height": height,
-            "num_images": num_images,
-        }
-        if negative_prompt:
-            payload["negative_prompt"] = negative_prompt
-        if seed is not None:
-            payload["seed"] = seed
-        if params:
-            payload.update(params)
-
-        kwargs: Dict[str, Any] = {"json": payload}
-        if include_steps:
-            kwargs["params"] = {"include_steps": "true"}
-        if not wait:
-            kwargs["headers"] = {"Prefer": "respond-async"}
-
-        data = self._client._request("POST", "/images/generate", **kwargs)
-        if data.get("request_id") and data.get("status") == "pending":
+        kwargs = _image_request_kwargs(
+            model=model,
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            width=width,
+            height=height,
+            num_images=num_images,
+            seed=seed,
+            params=params,
+            include_steps=include_steps,
+            wait=wait,
+        )
+        response, data = self._client._send("POST", "/images/generate", **kwargs)
+        if _is_pending(response, data):
             return GenerationRequest(request_id=data["request_id"], client=self._client)
         return ImageResult.from_dict(data)
 
+    def generate_many(
+        self,
+        specs: Sequence[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+    ) -> List[Union[ImageResult, GenerationRequest, Exception]]:
+        """Run several :meth:`generate` calls concurrently over the client's connection pool.
+
+        Args:
+            specs: Keyword arguments for each :meth:`generate` call, e.g.
+                ``{"model": "fal-ai/flux/schnell", "prompt": "a red fox"}``.
+            concurrency: Maximum number of requests in flight. Defaults to 8.
+
+        Returns:
+            One entry per spec, in order. A failed request yields its exception instead of
+            aborting the others.
+        """
+
+        def run(spec: Dict[str, Any]) -> Union[ImageResult, GenerationRequest, Exception]:
+            try:
+                return self.generate(**spec)
+            except Exception as exc:
+                return exc
+
+        if not specs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(specs))) as pool:
+            return list(pool.map(run, specs))
+
 
 class AsyncImages:
     """Image generation resource (async)."""
@@ -154,29 +221,40 @@ class AsyncImages:
         wait: bool = True,
     ) -> Union[ImageResult, AsyncGenerationRequest]:
         """Generate image(s). See :meth:`Images.generate` for details."""
-        payload: Dict[str, Any] = {
-            "model": model,
-            "prompt": prompt,
-            "width": width,
-            "height": height,
-            "num_images": num_images,
-        }
-        if negative_prompt:
-            payload["negative_prompt"] = negative_prompt
-        if seed is not None:
-            payload["seed"] = seed
-        if params:
-            payload.update(params)
-
-        kwargs: Dict[str, Any] = {"json": payload}
-        if include_steps:
-            kwargs["params"] = {"include_steps": "true"}
-        if not wait:
-            kwargs["headers"] = {"Prefer": "respond-async"}
-
-        data = await self._client._request("POST", "/images/generate", **kwargs)
-        if data.get("request_id") and data.get("status") == "pending":
+        kwargs = _image_request_kwargs(
+            model=model,
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            width=width,
+            height=height,
+            num_images=num_images,
+            seed=seed,
+            params=params,
+            include_steps=include_steps,
+            wait=wait,
+        )
+        response, data = await self._client._send("POST", "/images/generate", **kwargs)
+        if _is_pending(response, data):
             return AsyncGenerationRequest(
                 request_id=data["request_id"], client=self._client
             )
         return ImageResult.from_dict(data)
+
+    async def generate_many(
+        self,
+        specs: Sequence[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+    ) -> List[Union[ImageResult, AsyncGenerationRequest, BaseException]]:
+        """Run several :meth:`generate` calls concurrently (async).
+
+        See :meth:`Images.generate_many` for details. At most ``concurrency`` requests are in
+        flight at once.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run(spec: Dict[str, Any]) -> Union[ImageResult, AsyncGenerationRequest]:
+            async with sem:
+                return await self.generate(**spec)
+
+        return list(await asyncio.gather(*map(run, specs), return_exceptions=True))
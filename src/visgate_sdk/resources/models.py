@@ -1,14 +1,21 @@
 """Model catalog: ``GET /models``."""
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from visgate_sdk._json import loads
+from visgate_sdk._utils import DATACLASS_SLOTS
 
 if TYPE_CHECKING:
+    import httpx
+
     from visgate_sdk.client import AsyncClient, Client
 
 
-@dataclass
+@dataclass(repr=False, **DATACLASS_SLOTS)
 class ModelInfo:
     """Rich model information."""
     id: str
@@ -45,35 +52,36 @@ class ModelInfo:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> ModelInfo:
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            provider=data.get("provider", ""),
-            media_type=data.get("media_type", "image"),
-            description=data.get("description"),
-            category=data.get("category"),
-            tags=data.get("tags", []),
-            cover_image_url=data.get("cover_image_url"),
-            author=data.get("author"),
-            url=data.get("url"),
-            base_cost_micro=data.get("base_cost_micro", 0),
-            normalized_cost_micro=data.get("normalized_cost_micro", 0),
-            pricing=data.get("pricing"),
-            pricing_unit=data.get("pricing_unit"),
-            run_count=data.get("run_count", 0),
-            input_types=data.get("input_types", []),
-            output_type=data.get("output_type"),
-            capabilities=data.get("capabilities", []),
-            first_seen_at=data.get("first_seen_at"),
-            provider_created_at=data.get("provider_created_at"),
-            last_synced_at=data.get("last_synced_at"),
+            id=get("id", ""),
+            name=get("name", ""),
+            provider=get("provider", ""),
+            media_type=get("media_type", "image"),
+            description=get("description"),
+            category=get("category"),
+            tags=get("tags") or [],
+            cover_image_url=get("cover_image_url"),
+            author=get("author"),
+            url=get("url"),
+            base_cost_micro=get("base_cost_micro", 0),
+            normalized_cost_micro=get("normalized_cost_micro", 0),
+            pricing=get("pricing"),
+            pricing_unit=get("pricing_unit"),
+            run_count=get("run_count", 0),
+            input_types=get("input_types") or [],
+            output_type=get("output_type"),
+            capabilities=get("capabilities") or [],
+            first_seen_at=get("first_seen_at"),
+            provider_created_at=get("provider_created_at"),
+            last_synced_at=get("last_synced_at"),
         )
 
     def __repr__(self) -> str:
         return f"ModelInfo(id={self.id!r}, provider={self.provider!r}, media_type={self.media_type!r})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FeaturedSection:
     """A curated section of models."""
     title: str
@@ -85,11 +93,11 @@ class FeaturedSection:
         return cls(
             title=data.get("title", ""),
             key=data.get("key", ""),
-            models=[ModelInfo.from_dict(m) for m in data.get("models", [])],
+            models=list(map(ModelInfo.from_dict, data.get("models") or ())),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ModelsResponse:
     """Response from models.list()."""
     models: List[ModelInfo]
@@ -100,20 +108,77 @@ class ModelsResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ModelsResponse":
         featured_raw = data.get("featured")
-        featured = [FeaturedSection.from_dict(s) for s in featured_raw] if featured_raw else None
+        featured = list(map(FeaturedSection.from_dict, featured_raw)) if featured_raw else None
         return cls(
-            models=[ModelInfo.from_dict(m) for m in data.get("models", [])],
+            models=list(map(ModelInfo.from_dict, data.get("models") or ())),
             total_count=data.get("total_count", 0),
             last_updated=data.get("last_updated"),
             featured=featured,
         )
 
 
+_LIST_PARAM_KEYS = ("provider", "media_type", "capability", "search", "sort")
+
+
+def _build_list_params(
+    provider: Optional[str],
+    media_type: Optional[str],
+    capability: Optional[str],
+    search: Optional[str],
+    sort: Optional[str],
+    limit: int,
+    featured: bool,
+) -> Dict[str, Any]:
+    """Query string for ``GET /models``. Unset filters are left out."""
+    params: Dict[str, Any] = {"limit": limit}
+    params.update(
+        (k, v)
+        for k, v in zip(_LIST_PARAM_KEYS, (provider, media_type, capability, search, sort))
+        if v
+    )
+    if featured:
+        params["featured"] = "true"
+    return params
+
+
+class _ETagCache:
+    """Last ``ETag`` and response body per catalog URL, for conditional GETs.
+
+    The stored ETag is sent back as ``If-None-Match``. On ``304 Not Modified`` the cached
+    body is parsed again, so nothing has to be downloaded and every caller still gets its
+    own objects (a caller sorting ``models`` cannot change what the next one sees). Holds
+    at most ``maxsize`` URLs, dropping the oldest first.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[str, bytes]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, bytes]]:
+        return self._entries.get(key)
+
+    def store(self, key: Hashable, response: httpx.Response) -> None:
+        etag = response.headers.get("ETag")
+        if not etag:
+            # A newer body without an ETag makes any stored one stale
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (etag, response.content)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+def _if_none_match(hit: Optional[Tuple[str, bytes]]) -> Optional[Dict[str, str]]:
+    return {"If-None-Match": hit[0]} if hit is not None else None
+
+
 class Models:
     """Models resource (sync)."""
 
     def __init__(self, client: "Client"):
         self._client = client
+        self._etags = _ETagCache()
 
     def list(
         self,
@@ -145,21 +210,16 @@ class Models:
         """
         if model_type is not None and media_type is None:
             media_type = model_type
-        params: Dict[str, Any] = {"limit": limit}
-        if provider:
-            params["provider"] = provider
-        if media_type:
-            params["media_type"] = media_type
-        if capability:
-            params["capability"] = capability
-        if search:
-            params["search"] = search
-        if sort:
-            params["sort"] = sort
-        if featured:
-            params["featured"] = "true"
-
-        data = self._client._request("GET", "/models", params=params)
+        params = _build_list_params(provider, media_type, capability, search, sort, limit, featured)
+
+        key = ("/models", tuple(sorted(params.items())))
+        hit = self._etags.get(key)
+        response, data = self._client._send(
+            "GET", "/models", params=params, headers=_if_none_match(hit)
+        )
+        if hit is not None and response.status_code == 304:
+            return ModelsResponse.from_dict(loads(hit[1]))
+        self._etags.store(key, response)
         return ModelsResponse.from_dict(data)
 
     def get(self, model_id: str) -> ModelInfo:
@@ -172,7 +232,12 @@ class Models:
         Returns:
             ModelInfo with full model details
         """
-        data = self._client._request("GET", f"/models/{model_id}")
+        path = f"/models/{model_id}"
+        hit = self._etags.get(path)
+        response, data = self._client._send("GET", path, headers=_if_none_match(hit))
+        if hit is not None and response.status_code == 304:
+            return ModelInfo.from_dict(loads(hit[1]))
+        self._etags.store(path, response)
         return ModelInfo.from_dict(data)
 
     def search(self, query: str, *, limit: int = 20) -> ModelsResponse:
@@ -195,6 +260,7 @@ class AsyncModels:
 
     def __init__(self, client: "AsyncClient"):
         self._client = client
+        self._etags = _ETagCache()
 
     async def list(
         self,
@@ -211,28 +277,43 @@ class AsyncModels:
         """List available models (async). See Models.list for details."""
         if model_type is not None and media_type is None:
             media_type = model_type
-        params: Dict[str, Any] = {"limit": limit}
-        if provider:
-            params["provider"] = provider
-        if media_type:
-            params["media_type"] = media_type
-        if capability:
-            params["capability"] = capability
-        if search:
-            params["search"] = search
-        if sort:
-            params["sort"] = sort
-        if featured:
-            params["featured"] = "true"
-
-        data = await self._client._request("GET", "/models", params=params)
+        params = _build_list_params(provider, media_type, capability, search, sort, limit, featured)
+
+        key = ("/models", tuple(sorted(params.items())))
+        hit = self._etags.get(key)
+        response, data = await self._client._send(
+            "GET", "/models", params=params, headers=_if_none_match(hit)
+        )
+        if hit is not None and response.status_code == 304:
+            return ModelsResponse.from_dict(loads(hit[1]))
+        self._etags.store(key, response)
         return ModelsResponse.from_dict(data)
 
     async def get(self, model_id: str) -> ModelInfo:
         """Get detailed info for a model (async). See Models.get for details."""
-        data = await self._client._request("GET", f"/models/{model_id}")
+        path = f"/models/{model_id}"
+        hit = self._etags.get(path)
+        response, data = await self._client._send("GET", path, headers=_if_none_match(hit))
+        if hit is not None and response.status_code == 304:
+            return ModelInfo.from_dict(loads(hit[1]))
+        self._etags.store(path, response)
         return ModelInfo.from_dict(data)
 
+    async def get_many(
+        self, model_ids: Sequence[str], *, concurrency: int = 8
+    ) -> List[Union[ModelInfo, BaseException]]:
+        """Get several models concurrently (async).
+
+        Returns one entry per id, in order. A failed lookup yields its exception in place.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(model_id: str) -> ModelInfo:
+            async with sem:
+                return await self.get(model_id)
+
+        return list(await asyncio.gather(*map(one, model_ids), return_exceptions=True))
+
     async def search(self, query: str, *, limit: int = 20) -> ModelsResponse:
         """Search models (async). Shorthand for list(search=query)."""
         return await self.list(search=query, limit=limit)
@@ -2,11 +2,13 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from visgate_sdk._utils import DATACLASS_SLOTS
+
 if TYPE_CHECKING:
     from visgate_sdk.client import Client, AsyncClient
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProviderKeyInfo:
     provider: str
     validated: bool
@@ -17,32 +19,32 @@ class ProviderKeyInfo:
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderKeyInfo":
         return cls(
             provider=data.get("provider", ""),
-            validated=bool(data.get("validated", False)),
+            validated=bool(data.get("validated")),
             validated_at=data.get("validated_at"),
             masked_key=data.get("masked_key"),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProviderKeysResponse:
     keys: List[ProviderKeyInfo]
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderKeysResponse":
-        return cls(keys=[ProviderKeyInfo.from_dict(k) for k in data.get("keys", [])])
+        return cls(keys=list(map(ProviderKeyInfo.from_dict, data.get("keys") or ())))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProviderValidationResult:
     valid: bool
     message: str
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderValidationResult":
-        return cls(valid=bool(data.get("valid", False)), message=str(data.get("message", "")))
+        return cls(valid=bool(data.get("valid")), message=str(data.get("message", "")))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProviderBalanceItem:
     provider: str
     configured: bool
@@ -56,8 +58,8 @@ class ProviderBalanceItem:
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderBalanceItem":
         return cls(
             provider=data.get("provider", ""),
-            configured=bool(data.get("configured", False)),
-            available=bool(data.get("available", False)),
+            configured=bool(data.get("configured")),
+            available=bool(data.get("available")),
             limit=data.get("limit"),
             remaining=data.get("remaining"),
             currency=data.get("currency"),
@@ -65,13 +67,13 @@ class ProviderBalanceItem:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProviderBalancesResponse:
     balances: List[ProviderBalanceItem]
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderBalancesResponse":
-        return cls(balances=[ProviderBalanceItem.from_dict(b) for b in data.get("balances", [])])
+        return cls(balances=list(map(ProviderBalanceItem.from_dict, data.get("balances") or ())))
 
 
 class Providers:
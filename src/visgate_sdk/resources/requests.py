@@ -1,15 +1,36 @@
 """Async generation request status: ``GET /requests/{id}`` with optional polling."""
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from visgate_sdk._utils import DATACLASS_SLOTS
+from visgate_sdk.exceptions import RETRY_AFTER_HEADER, TimeoutError
 
 if TYPE_CHECKING:
+    import httpx
+
     from visgate_sdk.client import AsyncClient, Client
 
+# Request headers that ask the generate endpoints for a 202 and a request id instead of
+# blocking. Shared by every call: httpx copies them into each request.
+PREFER_ASYNC: Dict[str, str] = {"Prefer": "respond-async"}
+
+# Statuses after which a request no longer changes.
+_TERMINAL_STATUSES = frozenset(("completed", "failed"))
+
+# Growth factor of the poll delay. Gentler than doubling so short jobs are still seen soon.
+_POLL_BACKOFF = 1.3
+
+# Shortest long-poll window whose duration is trusted as proof the server held the call.
+_LONG_POLL_MIN_HOLD = 5
 
-@dataclass
+
+@dataclass(repr=False, **DATACLASS_SLOTS)
 class RequestStatusResult:
     """Status of an async generation request.
 
@@ -37,27 +58,115 @@ class RequestStatusResult:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> RequestStatusResult:
+        get = data.get
         return cls(
-            request_id=data.get("request_id", data.get("id", "")),
-            status=data.get("status", "pending"),
-            media_type=data.get("media_type", "video"),
-            provider=data.get("provider", ""),
-            model=data.get("model", ""),
-            output_url=data.get("output_url"),
-            error_message=data.get("error_message"),
-            created_at=data.get("created_at"),
-            completed_at=data.get("completed_at"),
+            request_id=get("request_id") or get("id", ""),
+            status=get("status", "pending"),
+            media_type=get("media_type", "video"),
+            provider=get("provider", ""),
+            model=get("model", ""),
+            output_url=get("output_url"),
+            error_message=get("error_message"),
+            created_at=get("created_at"),
+            completed_at=get("completed_at"),
         )
 
     @property
     def is_terminal(self) -> bool:
         """True when status is completed or failed."""
-        return self.status in ("completed", "failed")
+        return self.status in _TERMINAL_STATUSES
 
     def __repr__(self) -> str:
         return f"RequestStatusResult(request_id={self.request_id!r}, status={self.status!r})"
 
 
+def _is_pending(response: httpx.Response, data: Any) -> bool:
+    """Whether a generate call was accepted for background processing.
+
+    ``202 Accepted`` is the signal, but older servers answer 200 with a pending status body.
+    """
+    if response.status_code == 202:
+        return True
+    return isinstance(data, dict) and "request_id" in data and data.get("status") == "pending"
+
+
+def _long_poll_kwargs(
+    client_timeout: float, long_poll: Optional[float], remaining: float
+) -> Dict[str, Any]:
+    """Request kwargs for one status call: the ``wait`` hint plus a timeout that covers it."""
+    hold = int(min(long_poll or 0, remaining))
+    if hold < 1:
+        return {}
+    return {"params": {"wait": hold}, "timeout": client_timeout + hold}
+
+
+def _poll_delay(
+    poll_interval: float, poll_interval_max: float, attempt: int, remaining: float
+) -> float:
+    """Seconds to sleep before status poll ``attempt + 1``.
+
+    Exponential backoff from ``poll_interval`` up to ``poll_interval_max`` with full jitter
+    (uniform between 0 and that ceiling), so many waiting clients do not poll in lockstep.
+    Never sleeps past the time left, nor less than 0.1s.
+    """
+    ceiling = min(poll_interval_max, poll_interval * _POLL_BACKOFF**attempt)
+    return max(0.1, min(random.uniform(0, ceiling), remaining))
+
+
+def _server_delay(response: httpx.Response) -> Optional[float]:
+    """Seconds until the server suggests polling again, if it says so.
+
+    Read from ``Retry-After`` (seconds) or ``X-Estimated-Completion-Ms``. Missing or
+    unparseable values (e.g. an HTTP date) return None.
+    """
+    headers = response.headers
+    try:
+        if RETRY_AFTER_HEADER in headers:
+            return float(headers[RETRY_AFTER_HEADER])
+        if "X-Estimated-Completion-Ms" in headers:
+            return float(headers["X-Estimated-Completion-Ms"]) / 1000
+    except ValueError:
+        pass
+    return None
+
+
+def _still_running(result: object) -> bool:
+    """Whether a :meth:`Requests.get_many` entry should be polled again."""
+    return isinstance(result, RequestStatusResult) and result.status not in _TERMINAL_STATUSES
+
+
+def _round_delay(
+    hints: List[Optional[float]],
+    poll_interval: float,
+    poll_interval_max: float,
+    attempt: int,
+    remaining: float,
+) -> float:
+    """Seconds to sleep between :meth:`Requests.get_many` rounds.
+
+    The soonest server hint among the round's responses (see :func:`_server_delay`) wins,
+    so a request the server expects to finish early is not kept waiting by the others.
+    Without any hint this is :func:`_poll_delay`.
+    """
+    given = [h for h in hints if h is not None]
+    if not given:
+        return _poll_delay(poll_interval, poll_interval_max, attempt, remaining)
+    return max(0.1, min(min(given), remaining))
+
+
+def _held(kwargs: Dict[str, Any], seconds: float) -> bool:
+    """Whether the server honoured the long-poll hint in ``kwargs``.
+
+    True only when a hint of at least ``_LONG_POLL_MIN_HOLD`` seconds was sent and the call
+    stayed open for nearly all of it. A slow server that ignores ``?wait=`` answers well
+    before that, so it is never mistaken for a held call and polled without a sleep.
+    """
+    if not kwargs:
+        return False
+    window = kwargs["params"]["wait"]
+    return window >= _LONG_POLL_MIN_HOLD and seconds >= window * 0.9
+
+
 class GenerationRequest:
     """Response from async generation (202) with sync client. Use :meth:`wait` to poll."""
 
@@ -65,20 +174,47 @@ class GenerationRequest:
         self.request_id = request_id
         self.status = "pending"
         self._client = client
+        self._lock = threading.Lock()
+        self._result: Optional[RequestStatusResult] = None
 
     def wait(
         self,
         *,
         timeout: float = 300.0,
         poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+        long_poll: Optional[float] = None,
     ) -> RequestStatusResult:
-        """Poll until completed or failed. Returns final RequestStatusResult."""
-        return self._client.requests.get(
-            self.request_id,
-            wait=True,
-            timeout=timeout,
-            poll_interval=poll_interval,
-        )
+        """Poll until completed or failed. Returns final RequestStatusResult.
+
+        Threads waiting on the same request share one polling loop, and once the request
+        has finished further calls return the final result without a request. Time spent
+        waiting for another thread's poll counts against ``timeout``; if that poll is still
+        running when it runs out, TimeoutError is raised. See :meth:`Requests.get` for
+        ``long_poll``.
+        """
+        start = time.monotonic()
+        if not self._lock.acquire(timeout=max(timeout, 0)):
+            raise TimeoutError(
+                f"Timed out after {timeout}s waiting for another wait() on {self.request_id}"
+            )
+        try:
+            if self._result is not None:
+                return self._result
+            result = self._client.requests.get(
+                self.request_id,
+                wait=True,
+                timeout=max(0.0, timeout - (time.monotonic() - start)),
+                poll_interval=poll_interval,
+                poll_interval_max=poll_interval_max,
+                long_poll=long_poll,
+            )
+            self.status = result.status
+            if result.is_terminal:
+                self._result = result
+            return result
+        finally:
+            self._lock.release()
 
     def __repr__(self) -> str:
         return f"GenerationRequest(request_id={self.request_id!r})"
@@ -91,20 +227,55 @@ class AsyncGenerationRequest:
         self.request_id = request_id
         self.status = "pending"
         self._client = client
+        self._poll: Optional[asyncio.Future[RequestStatusResult]] = None
+        self._result: Optional[RequestStatusResult] = None
 
     async def wait(
         self,
         *,
         timeout: float = 300.0,
         poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+        long_poll: Optional[float] = None,
     ) -> RequestStatusResult:
-        """Poll until completed or failed. Returns final RequestStatusResult."""
-        return await self._client.requests.get(
-            self.request_id,
-            wait=True,
-            timeout=timeout,
-            poll_interval=poll_interval,
+        """Poll until completed or failed. Returns final RequestStatusResult.
+
+        Coroutines waiting on the same request at the same time share one polling task
+        (started with the first caller's arguments), and once the request has finished
+        further calls return the final result without a request. A caller that joins a
+        running poll still gets its own ``timeout``: TimeoutError is raised if the shared
+        poll has not finished by then. See :meth:`Requests.get` for ``long_poll``.
+        """
+        if self._result is not None:
+            return self._result
+        poll = self._poll
+        if poll is not None and not poll.done():
+            try:
+                # Shielded so one cancelled or timed-out waiter does not cancel the poll
+                result = await asyncio.wait_for(asyncio.shield(poll), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Timed out after {timeout}s waiting for another wait() on {self.request_id}"
+                ) from None
+            return self._settle(result)
+        self._poll = asyncio.ensure_future(
+            self._client.requests.get(
+                self.request_id,
+                wait=True,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                poll_interval_max=poll_interval_max,
+                long_poll=long_poll,
+            )
         )
+        # Shielded so one cancelled waiter does not cancel the poll for the others
+        return self._settle(await asyncio.shield(self._poll))
+
+    def _settle(self, result: RequestStatusResult) -> RequestStatusResult:
+        self.status = result.status
+        if result.is_terminal:
+            self._result = result
+        return result
 
     def __repr__(self) -> str:
         return f"AsyncGenerationRequest(request_id={self.request_id!r})"
@@ -123,6 +294,8 @@ class Requests:
         wait: bool = False,
         timeout: float = 300.0,
         poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+        long_poll: Optional[float] = None,
     ) -> RequestStatusResult:
         """Get status of an async generation request.
 
@@ -130,21 +303,93 @@ class Requests:
             request_id: Request ID from 202 response.
             wait: If True, poll until completed or failed (or timeout).
             timeout: Max seconds to wait when wait=True. Defaults to 300.
-            poll_interval: Seconds between polls when wait=True. Defaults to 2.
+            poll_interval: Initial seconds between polls when wait=True. Defaults to 2. The
+                delay grows with each poll and is jittered.
+            poll_interval_max: Upper bound for the delay between polls. Defaults to 30.
+            long_poll: When wait=True, ask the server to hold each status request open for
+                up to this many seconds (``?wait=``) so completion is seen as soon as it
+                happens. After a call the server held open for nearly the whole window
+                (windows under 5s are never trusted), the next poll is sent without a
+                sleep. When the hint is not honoured, polls are at least ``poll_interval``
+                apart.
+
+        Between polls, a ``Retry-After`` or ``X-Estimated-Completion-Ms`` header on the
+        status response sets the delay instead of the backoff.
 
         Returns:
             RequestStatusResult with status, output_url when completed, or error_message when failed.
         """
-        start = time.perf_counter()
+        send = self._client._send
+        path = f"/requests/{request_id}"
+        deadline = time.monotonic() + timeout
+        hold = long_poll if wait else None
+        attempt = 0
         while True:
-            data = self._client._request("GET", f"/requests/{request_id}")
+            sent = time.monotonic()
+            kwargs = _long_poll_kwargs(self._client.timeout, hold, deadline - sent)
+            response, data = send("GET", path, **kwargs)
             result = RequestStatusResult.from_dict(data)
-            if not wait or result.is_terminal:
+            if not wait or result.status in _TERMINAL_STATUSES:
                 return result
-            elapsed = time.perf_counter() - start
-            if elapsed >= timeout:
+            now = time.monotonic()
+            if now >= deadline:
                 return result
-            time.sleep(min(poll_interval, max(0.1, timeout - elapsed)))
+            if _held(kwargs, now - sent):
+                continue
+            delay = _server_delay(response)
+            if delay is None:
+                delay = _poll_delay(poll_interval, poll_interval_max, attempt, deadline - now)
+            if kwargs:
+                # The hint was sent but not honoured: never poll faster than poll_interval
+                delay = max(delay, poll_interval)
+            time.sleep(max(0.1, min(delay, deadline - now)))
+            attempt += 1
+
+    def get_many(
+        self,
+        request_ids: Sequence[str],
+        *,
+        wait: bool = False,
+        timeout: float = 300.0,
+        poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+    ) -> Dict[str, Union[RequestStatusResult, Exception]]:
+        """Get the status of several async generation requests.
+
+        With wait=True the requests are polled as one group: each round fetches the ones
+        still running, then a single delay is slept before the next round. That delay is
+        the soonest ``Retry-After`` / ``X-Estimated-Completion-Ms`` hint of the round, or
+        the backoff of :meth:`get` when the server gives none. Finished requests are not
+        fetched again. A failed call (e.g. an unknown id) does not abort the others: its
+        exception is stored under that id and the id is not polled again.
+
+        Returns:
+            Dict mapping each request ID to its latest RequestStatusResult, or to the
+            exception raised while fetching it. After a timeout some results may still be
+            non-terminal.
+        """
+        send = self._client._send
+        results: Dict[str, Union[RequestStatusResult, Exception]] = {}
+        pending: List[str] = list(dict.fromkeys(request_ids))
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            hints: List[Optional[float]] = []
+            for request_id in pending:
+                try:
+                    response, data = send("GET", f"/requests/{request_id}")
+                except Exception as exc:
+                    results[request_id] = exc
+                    continue
+                results[request_id] = RequestStatusResult.from_dict(data)
+                hints.append(_server_delay(response))
+            pending = [i for i in pending if _still_running(results[i])]
+            now = time.monotonic()
+            if not wait or not pending or now >= deadline:
+                return results
+            delay = _round_delay(hints, poll_interval, poll_interval_max, attempt, deadline - now)
+            time.sleep(delay)
+            attempt += 1
 
 
 class AsyncRequests:
@@ -160,17 +405,112 @@ class AsyncRequests:
         wait: bool = False,
         timeout: float = 300.0,
         poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+        long_poll: Optional[float] = None,
     ) -> RequestStatusResult:
         """Get status of an async generation request. See :meth:`Requests.get` for details."""
-        import asyncio
-
-        start = time.perf_counter()
+        send = self._client._send
+        path = f"/requests/{request_id}"
+        deadline = time.monotonic() + timeout
+        hold = long_poll if wait else None
+        attempt = 0
         while True:
-            data = await self._client._request("GET", f"/requests/{request_id}")
+            sent = time.monotonic()
+            kwargs = _long_poll_kwargs(self._client.timeout, hold, deadline - sent)
+            response, data = await send("GET", path, **kwargs)
             result = RequestStatusResult.from_dict(data)
-            if not wait or result.is_terminal:
+            if not wait or result.status in _TERMINAL_STATUSES:
                 return result
-            elapsed = time.perf_counter() - start
-            if elapsed >= timeout:
+            now = time.monotonic()
+            if now >= deadline:
                 return result
-            await asyncio.sleep(min(poll_interval, max(0.1, timeout - elapsed)))
+            if _held(kwargs, now - sent):
+                continue
+            delay = _server_delay(response)
+            if delay is None:
+                delay = _poll_delay(poll_interval, poll_interval_max, attempt, deadline - now)
+            if kwargs:
+                # The hint was sent but not honoured: never poll faster than poll_interval
+                delay = max(delay, poll_interval)
+            await asyncio.sleep(max(0.1, min(delay, deadline - now)))
+            attempt += 1
+
+    async def get_many(
+        self,
+        request_ids: Sequence[str],
+        *,
+        wait: bool = False,
+        timeout: float = 300.0,
+        poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+        concurrency: int = 8,
+    ) -> Dict[str, Union[RequestStatusResult, BaseException]]:
+        """Get the status of several requests (async). See :meth:`Requests.get_many`.
+
+        The status calls of one round run concurrently, at most ``concurrency`` at a time.
+        Errors are kept per id, as in the sync version.
+        """
+        send = self._client._send
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(request_id: str) -> Tuple[RequestStatusResult, Optional[float]]:
+            async with sem:
+                response, data = await send("GET", f"/requests/{request_id}")
+            return RequestStatusResult.from_dict(data), _server_delay(response)
+
+        results: Dict[str, Union[RequestStatusResult, BaseException]] = {}
+        pending: List[str] = list(dict.fromkeys(request_ids))
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            batch = await asyncio.gather(*map(one, pending), return_exceptions=True)
+            hints: List[Optional[float]] = []
+            for request_id, outcome in zip(pending, batch):
+                if isinstance(outcome, BaseException):
+                    results[request_id] = outcome
+                else:
+                    results[request_id], hint = outcome
+                    hints.append(hint)
+            pending = [i for i in pending if _still_running(results[i])]
+            now = time.monotonic()
+            if not wait or not pending or now >= deadline:
+                return results
+            delay = _round_delay(hints, poll_interval, poll_interval_max, attempt, deadline - now)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def wait_all(
+        self,
+        requests: Sequence[AsyncGenerationRequest],
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 2.0,
+        poll_interval_max: float = 30.0,
+        concurrency: int = 8,
+    ) -> Dict[str, Union[RequestStatusResult, BaseException]]:
+        """Wait for several generation requests with one polling loop (async).
+
+        Unlike gathering ``wait()`` on each handle, all pending requests share a single
+        backoff timer (see :meth:`get_many`). Each handle's ``status`` is updated, and a
+        finished handle keeps its result so a later ``wait()`` returns without a request.
+
+        Returns:
+            Dict mapping request ID to its last RequestStatusResult, or to the exception
+            raised while fetching it.
+        """
+        results = await self.get_many(
+            [r.request_id for r in requests if r._result is None],
+            wait=True,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            poll_interval_max=poll_interval_max,
+            concurrency=concurrency,
+        )
+        for handle in requests:
+            result = handle._result or results[handle.request_id]
+            results[handle.request_id] = result
+            if isinstance(result, RequestStatusResult):
+                handle.status = result.status
+                if result.is_terminal:
+                    handle._result = result
+        return results
@@ -1,10 +1,12 @@
 """Usage and billing: ``GET /usage``, ``GET /usage/logs``, ``GET /dashboard``."""
 from __future__ import annotations
 
+import copy
+import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from visgate_sdk._utils import parse_datetime
+from visgate_sdk._utils import DATACLASS_SLOTS, parse_datetime
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -12,7 +14,7 @@ if TYPE_CHECKING:
     from visgate_sdk.client import AsyncClient, Client
 
 
-@dataclass
+@dataclass(repr=False, **DATACLASS_SLOTS)
 class UsageSummary:
     """Usage statistics for a time period.
 
@@ -53,19 +55,28 @@ class UsageSummary:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> UsageSummary:
+        get = data.get
+        # Older API versions use total_cost_usd / provider_breakdown. The fallback key is
+        # only looked up when the current one is absent.
+        billed = get("total_billed_cost")
+        if billed is None:
+            billed = get("total_cost_usd", 0.0)
+        by_provider = get("by_provider")
+        if by_provider is None:
+            by_provider = get("provider_breakdown") or {}
         return cls(
-            total_requests=data.get("total_requests", 0),
-            successful_requests=data.get("successful_requests", 0),
-            failed_requests=data.get("failed_requests", 0),
-            cached_requests=data.get("cached_requests", 0),
-            total_provider_cost=data.get("total_provider_cost", 0.0),
-            total_billed_cost=data.get("total_billed_cost", data.get("total_cost_usd", 0.0)),
-            total_savings=data.get("total_savings", 0.0),
-            by_provider=data.get("by_provider", data.get("provider_breakdown", {})),
-            by_model=data.get("by_model", {}),
-            period=data.get("period", "month"),
-            period_start=parse_datetime(data.get("period_start")),
-            period_end=parse_datetime(data.get("period_end")),
+            total_requests=get("total_requests", 0),
+            successful_requests=get("successful_requests", 0),
+            failed_requests=get("failed_requests", 0),
+            cached_requests=get("cached_requests", 0),
+            total_provider_cost=get("total_provider_cost", 0.0),
+            total_billed_cost=billed,
+            total_savings=get("total_savings", 0.0),
+            by_provider=by_provider,
+            by_model=get("by_model") or {},
+            period=get("period", "month"),
+            period_start=parse_datetime(get("period_start")),
+            period_end=parse_datetime(get("period_end")),
         )
 
     def __repr__(self) -> str:
@@ -75,22 +86,59 @@ class UsageSummary:
         )
 
 
+def _log_entries(data: Any) -> List[Dict[str, Any]]:
+    """Log entries from a ``/usage/logs`` body (a bare list or ``{"logs": [...]}``)."""
+    return data if isinstance(data, list) else data.get("logs", [])
+
+
+class _Recent:
+    """Last raw payload per (endpoint, period) with its fetch time, reused for ``max_age``.
+
+    Every caller gets its own deep copy, so changing a returned summary or dashboard dict
+    never leaks into the next cache hit.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+    def get(self, key: Tuple[str, str], max_age: float) -> Optional[Dict[str, Any]]:
+        if max_age > 0:
+            hit = self._entries.get(key)
+            if hit is not None and time.monotonic() - hit[0] < max_age:
+                return copy.deepcopy(hit[1])
+        return None
+
+    def put(self, key: Tuple[str, str], data: Dict[str, Any]) -> Dict[str, Any]:
+        self._entries[key] = (time.monotonic(), data)
+        return copy.deepcopy(data)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class Usage:
     """Usage and billing resource (sync)."""
 
     def __init__(self, client: Client) -> None:
         self._client = client
+        self._recent = _Recent()
 
-    def get(self, period: str = "month") -> UsageSummary:
+    def get(self, period: str = "month", *, max_age: float = 0.0) -> UsageSummary:
         """Get usage summary for a time period.
 
         Args:
             period: ``"day"``, ``"week"``, ``"month"``, or ``"year"``.
+            max_age: Reuse the last summary for this period if it was fetched less than
+                this many seconds ago. Defaults to 0 (always fetch).
 
         Returns:
             UsageSummary with aggregated statistics.
         """
-        data = self._client._request("GET", "/usage", params={"period": period})
+        key = ("usage", period)
+        data = self._recent.get(key, max_age)
+        if data is None:
+            fetched = self._client._request("GET", "/usage", params={"period": period})
+            data = self._recent.put(key, fetched)
         return UsageSummary.from_dict(data)
 
     def logs(self, *, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
@@ -106,18 +154,52 @@ class Usage:
         data = self._client._request(
             "GET", "/usage/logs", params={"limit": limit, "offset": offset}
         )
-        return data if isinstance(data, list) else data.get("logs", [])
+        return _log_entries(data)
+
+    def iter_logs(self, *, page_size: int = 200, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Iterate over all usage log entries, fetching ``page_size`` entries per request.
+
+        Pages are requested lazily, so only one page is held in memory at a time and
+        breaking out of the loop stops further requests. Iteration ends at the first short
+        or empty page. A ``page_size`` below 1 raises ValueError.
+
+        Args:
+            page_size: Entries per ``/usage/logs`` request. Defaults to 200.
+            offset: Number of entries to skip before the first one.
 
-    def dashboard(self, period: str = "month") -> Dict[str, Any]:
+        Yields:
+            Log entry dicts, in the order the API returns them.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        while True:
+            page = self.logs(limit=page_size, offset=offset)
+            yield from page
+            if not page or len(page) < page_size:
+                return
+            offset += len(page)
+
+    def dashboard(self, period: str = "month", *, max_age: float = 0.0) -> Dict[str, Any]:
         """Get dashboard summary data.
 
         Args:
             period: ``"day"``, ``"week"``, ``"month"``, or ``"year"``.
+            max_age: Reuse the last dashboard for this period if it was fetched less than
+                this many seconds ago. Defaults to 0 (always fetch).
 
         Returns:
             Dict with dashboard metrics.
         """
-        return self._client._request("GET", "/dashboard", params={"period": period})
+        key = ("dashboard", period)
+        data = self._recent.get(key, max_age)
+        if data is None:
+            fetched = self._client._request("GET", "/dashboard", params={"period": period})
+            data = self._recent.put(key, fetched)
+        return data
+
+    def invalidate(self) -> None:
+        """Forget cached summaries, e.g. after generating, so ``max_age`` refetches."""
+        self._recent.clear()
 
 
 class AsyncUsage:
@@ -125,10 +207,15 @@ class AsyncUsage:
 
     def __init__(self, client: AsyncClient) -> None:
         self._client = client
+        self._recent = _Recent()
 
-    async def get(self, period: str = "month") -> UsageSummary:
+    async def get(self, period: str = "month", *, max_age: float = 0.0) -> UsageSummary:
         """Get usage summary (async). See :meth:`Usage.get` for details."""
-        data = await self._client._request("GET", "/usage", params={"period": period})
+        key = ("usage", period)
+        data = self._recent.get(key, max_age)
+        if data is None:
+            fetched = await self._client._request("GET", "/usage", params={"period": period})
+            data = self._recent.put(key, fetched)
         return UsageSummary.from_dict(data)
 
     async def logs(self, *, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
@@ -136,8 +223,31 @@ class AsyncUsage:
         data = await self._client._request(
             "GET", "/usage/logs", params={"limit": limit, "offset": offset}
         )
-        return data if isinstance(data, list) else data.get("logs", [])
-
-    async def dashboard(self, period: str = "month") -> Dict[str, Any]:
+        return _log_entries(data)
+
+    async def iter_logs(
+        self, *, page_size: int = 200, offset: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all usage log entries (async). See :meth:`Usage.iter_logs`."""
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        while True:
+            page = await self.logs(limit=page_size, offset=offset)
+            for entry in page:
+                yield entry
+            if not page or len(page) < page_size:
+                return
+            offset += len(page)
+
+    async def dashboard(self, period: str = "month", *, max_age: float = 0.0) -> Dict[str, Any]:
         """Get dashboard summary (async). See :meth:`Usage.dashboard` for details."""
-        return await self._client._request("GET", "/dashboard", params={"period": period})
+        key = ("dashboard", period)
+        data = self._recent.get(key, max_age)
+        if data is None:
+            fetched = await self._client._request("GET", "/dashboard", params={"period": period})
+            data = self._recent.put(key, fetched)
+        return data
+
+    def invalidate(self) -> None:
+        """Forget cached summaries. See :meth:`Usage.invalidate`."""
+        self._recent.clear()
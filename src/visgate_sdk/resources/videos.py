@@ -4,8 +4,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from visgate_sdk._utils import parse_datetime
-from visgate_sdk.resources.requests import AsyncGenerationRequest, GenerationRequest
+from visgate_sdk._utils import DATACLASS_SLOTS, parse_datetime
+from visgate_sdk.resources.requests import (
+    PREFER_ASYNC,
+    AsyncGenerationRequest,
+    GenerationRequest,
+    _is_pending,
+)
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -13,7 +18,7 @@ if TYPE_CHECKING:
     from visgate_sdk.client import AsyncClient, Client
 
 
-@dataclass
+@dataclass(repr=False, **DATACLASS_SLOTS)
 class VideoResult:
     """Result of a video generation request.
 
@@ -41,16 +46,17 @@ class VideoResult:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> VideoResult:
+        get = data.get
         return cls(
             id=data["id"],
-            video_url=data.get("video_url"),
+            video_url=get("video_url"),
             model=data["model"],
             provider=data["provider"],
-            cost=data.get("cost", 0.0),
-            cache_hit=data.get("cache_hit", False),
-            provider_cost_avoided_micro=data.get("provider_cost_avoided_micro"),
-            latency_ms=data.get("latency_ms"),
-            created_at=parse_datetime(data.get("created_at")),
+            cost=get("cost", 0.0),
+            cache_hit=get("cache_hit", False),
+            provider_cost_avoided_micro=get("provider_cost_avoided_micro"),
+            latency_ms=get("latency_ms"),
+            created_at=parse_datetime(get("created_at")),
         )
 
     def __repr__(self) -> str:
@@ -60,6 +66,33 @@ class VideoResult:
         )
 
 
+def _video_request_kwargs(
+    *,
+    model: str,
+    prompt: str,
+    image_url: Optional[str],
+    duration_seconds: float,
+    skip_gcs_upload: bool,
+    params: Optional[Dict[str, Any]],
+    wait: bool,
+) -> Dict[str, Any]:
+    """``_send`` keyword arguments for ``POST /videos/generate`` (shared by sync and async)."""
+    payload: Dict[str, Any] = {
+        "model": model,
+        "prompt": prompt,
+        "duration_seconds": duration_seconds,
+    }
+    if image_url:
+        payload["image_url"] = image_url
+    if skip_gcs_upload:
+        payload["skip_gcs_upload"] = True
+    if params:
+        payload.update(params)
+    if wait:
+        return {"json": payload}
+    return {"json": payload, "headers": PREFER_ASYNC}
+
+
 class Videos:
     """Video generation resource (sync)."""
 
@@ -93,24 +126,17 @@ class Videos:
         Returns:
             VideoResult when wait=True, or GenerationRequest when wait=False.
         """
-        payload: Dict[str, Any] = {
-            "model": model,
-            "prompt": prompt,
-            "duration_seconds": duration_seconds,
-        }
-        if image_url:
-            payload["image_url"] = image_url
-        if skip_gcs_upload:
-            payload["skip_gcs_upload"] = True
-        if params:
-            payload.update(params)
-
-        kwargs: Dict[str, Any] = {"json": payload}
-        if not wait:
-            kwargs["headers"] = {"Prefer": "respond-async"}
-
-        data = self._client._request("POST", "/videos/generate", **kwargs)
-        if data.get("request_id") and data.get("status") == "pending":
+        kwargs = _video_request_kwargs(
+            model=model,
+            prompt=prompt,
+            image_url=image_url,
+            duration_seconds=duration_seconds,
+            skip_gcs_upload=skip_gcs_upload,
+            params=params,
+            wait=wait,
+        )
+        response, data = self._client._send("POST", "/videos/generate", **kwargs)
+        if _is_pending(response, data):
             return GenerationRequest(request_id=data["request_id"], client=self._client)
         return VideoResult.from_dict(data)
 
@@ -133,24 +159,17 @@ class AsyncVideos:
         wait: bool = True,
     ) -> Union[VideoResult, AsyncGenerationRequest]:
         """Generate a video (async). See :meth:`Videos.generate` for details."""
-        payload: Dict[str, Any] = {
-            "model": model,
-            "prompt": prompt,
-            "duration_seconds": duration_seconds,
-        }
-        if image_url:
-            payload["image_url"] = image_url
-        if skip_gcs_upload:
-            payload["skip_gcs_upload"] = True
-        if params:
-            payload.update(params)
-
-        kwargs: Dict[str, Any] = {"json": payload}
-        if not wait:
-            kwargs["headers"] = {"Prefer": "respond-async"}
-
-        data = await self._client._request("POST", "/videos/generate", **kwargs)
-        if data.get("request_id") and data.get("status") == "pending":
+        kwargs = _video_request_kwargs(
+            model=model,
+            prompt=prompt,
+            image_url=image_url,
+            duration_seconds=duration_seconds,
+            skip_gcs_upload=skip_gcs_upload,
+            params=params,
+            wait=wait,
+        )
+        response, data = await self._client._send("POST", "/videos/generate", **kwargs)
+        if _is_pending(response, data):
             return AsyncGenerationRequest(
                 request_id=data["request_id"], client=self._client
             )
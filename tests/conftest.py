@@ -0,0 +1,23 @@
+"""Shared fixtures for the visgate-sdk tests."""
+from __future__ import annotations
+
+import pytest
+
+from visgate_sdk import Client
+
+
+@pytest.fixture(scope="session")
+def default_client():
+    """One ``Client(api_key="k")`` for tests that only read its attributes.
+
+    Tests that change headers or pass other constructor arguments build their own.
+    """
+    client = Client(api_key="k")
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def _clean_visgate_env(monkeypatch):
+    """Start every test without ``VISGATE_API_KEY`` so the developer's shell cannot leak in."""
+    monkeypatch.delenv("VISGATE_API_KEY", raising=False)
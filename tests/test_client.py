@@ -1,14 +1,23 @@
 """Unit tests for visgate-sdk."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
 
 from visgate_sdk import Client, AsyncClient, __version__
-from visgate_sdk.client import _handle_response, _resolve_api_key, _get_version
+from visgate_sdk._transport import RetryTransport, _backoff, _environment_proxies
+from visgate_sdk._version import _get_version
+from visgate_sdk.client import _build_headers, _handle_response, _resolve_api_key
 from visgate_sdk.exceptions import (
+    STATUS_TO_EXC,
     AuthenticationError,
     ConnectionError,
     ProviderError,
@@ -19,15 +28,23 @@ from visgate_sdk.exceptions import (
 )
 from visgate_sdk.resources.generate import GenerateResult
 from visgate_sdk.resources.images import ImageResult
-from visgate_sdk.resources.models import ModelInfo, ModelsResponse
-from visgate_sdk.resources.requests import RequestStatusResult
+from visgate_sdk.resources.models import ModelInfo, ModelsResponse, _build_list_params
+from visgate_sdk.resources.requests import (
+    AsyncGenerationRequest,
+    AsyncRequests,
+    GenerationRequest,
+    Requests,
+    RequestStatusResult,
+    _held,
+    _poll_delay,
+)
 from visgate_sdk.resources.providers import (
     ProviderBalanceItem,
     ProviderKeyInfo,
     ProviderKeysResponse,
     ProviderValidationResult,
 )
-from visgate_sdk.resources.usage import UsageSummary
+from visgate_sdk.resources.usage import Usage, UsageSummary
 from visgate_sdk.resources.videos import VideoResult
 
 
@@ -35,16 +52,10 @@ from visgate_sdk.resources.videos import VideoResult
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _mock_response(status_code: int, json_data=None, text="", headers=None):
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = status_code
-    resp.text = text
-    resp.headers = headers or {}
-    if json_data is not None:
-        resp.json.return_value = json_data
-    else:
-        resp.json.side_effect = Exception("No JSON")
-    return resp
+def _api_response(status_code: int, json_data=None, text="", headers=None) -> httpx.Response:
+    """Real ``httpx.Response`` with a JSON body, or ``text`` when there is no JSON."""
+    content = json.dumps(json_data).encode() if json_data is not None else text.encode()
+    return httpx.Response(status_code, headers=headers, content=content)
 
 
 # ---------------------------------------------------------------------------
@@ -66,105 +77,102 @@ def test_version_fallback():
 # API key resolution
 # ---------------------------------------------------------------------------
 
-def test_resolve_api_key_from_argument():
-    assert _resolve_api_key("vg-test") == "vg-test"
-
-
-def test_resolve_api_key_from_env(monkeypatch):
-    monkeypatch.setenv("VISGATE_API_KEY", "vg-from-env")
-    assert _resolve_api_key(None) == "vg-from-env"
+@pytest.mark.parametrize(
+    "arg, env, expected",
+    [
+        pytest.param("vg-test", None, "vg-test", id="argument"),
+        pytest.param(None, "vg-from-env", "vg-from-env", id="env"),
+        pytest.param("vg-explicit", "vg-from-env", "vg-explicit", id="argument-overrides-env"),
+    ],
+)
+def test_resolve_api_key(monkeypatch, arg, env, expected):
+    if env is not None:
+        monkeypatch.setenv("VISGATE_API_KEY", env)
+    assert _resolve_api_key(arg) == expected
 
 
-def test_resolve_api_key_raises_without_key(monkeypatch):
-    monkeypatch.delenv("VISGATE_API_KEY", raising=False)
+def test_resolve_api_key_raises_without_key():
     with pytest.raises(AuthenticationError, match="No API key"):
         _resolve_api_key(None)
 
 
-def test_resolve_api_key_argument_overrides_env(monkeypatch):
-    monkeypatch.setenv("VISGATE_API_KEY", "vg-from-env")
-    assert _resolve_api_key("vg-explicit") == "vg-explicit"
-
-
 # ---------------------------------------------------------------------------
 # Client instantiation
 # ---------------------------------------------------------------------------
 
 def test_client_instantiates():
-    client = Client(api_key="test-key", base_url="https://example.com/api")
-    assert client.base_url == "https://example.com/api"
-    assert client.api_key == "test-key"
-    client.close()
+    with Client(api_key="test-key", base_url="https://example.com/api") as client:
+        assert client.base_url == "https://example.com/api"
+        assert client.api_key == "test-key"
 
 
 def test_client_strips_trailing_slash():
-    client = Client(api_key="k", base_url="https://example.com/api/")
-    assert client.base_url == "https://example.com/api"
-    client.close()
+    with Client(api_key="k", base_url="https://example.com/api/") as client:
+        assert client.base_url == "https://example.com/api"
 
 
-def test_client_default_base_url():
-    client = Client(api_key="k")
-    assert client.base_url == "https://visgateai.com/api/v1"
-    client.close()
+def test_client_default_base_url(default_client):
+    assert default_client.base_url == "https://visgateai.com/api/v1"
 
 
 def test_client_from_env(monkeypatch):
     monkeypatch.setenv("VISGATE_API_KEY", "vg-env-test")
-    client = Client()
-    assert client.api_key == "vg-env-test"
-    client.close()
-
-
-def test_client_has_all_resources():
-    client = Client(api_key="k")
-    assert client.images is not None
-    assert client.models is not None
-    assert client.videos is not None
-    assert client.requests is not None
-    assert client.usage is not None
-    assert client.providers is not None
-    client.close()
-
-
-def test_client_fal_key_header():
-    client = Client(api_key="k", fal_key="fal-test")
-    headers = dict(client._client.headers)
-    assert headers.get("x-fal-key") == "fal-test"
-    client.close()
+    with Client() as client:
+        assert client.api_key == "vg-env-test"
+
+
+def test_client_has_all_resources(default_client):
+    assert default_client.images is not None
+    assert default_client.models is not None
+    assert default_client.videos is not None
+    assert default_client.requests is not None
+    assert default_client.usage is not None
+    assert default_client.providers is not None
+
+
+@pytest.mark.parametrize(
+    "kw, header, value",
+    [
+        ("fal_key", "x-fal-key", "fal-test"),
+        ("replicate_key", "x-replicate-key", "rep-test"),
+        ("runway_key", "x-runway-key", "rw-test"),
+    ],
+)
+def test_client_provider_key_header(kw, header, value):
+    with Client(api_key="k", **{kw: value}) as client:
+        assert client._client.headers.get(header) == value
 
 
-def test_client_replicate_key_header():
-    client = Client(api_key="k", replicate_key="rep-test")
-    headers = dict(client._client.headers)
-    assert headers.get("x-replicate-key") == "rep-test"
-    client.close()
+def test_client_set_provider_headers_keeps_connection_pool():
+    with Client(api_key="k", fal_key="fal-test") as client:
+        pool = client._client
+        client.set_provider_headers(runway_key="rw-test")
+        assert client._client is pool
+        headers = client._client.headers
+        assert "x-fal-key" not in headers
+        assert headers.get("x-runway-key") == "rw-test"
 
 
-def test_client_runway_key_header():
-    client = Client(api_key="k", runway_key="rw-test")
-    headers = dict(client._client.headers)
-    assert headers.get("x-runway-key") == "rw-test"
-    client.close()
+def test_client_user_agent(default_client):
+    ua = default_client._client.headers.get("user-agent", "")
+    assert ua.startswith("visgate-sdk-python/")
 
 
-def test_client_user_agent():
-    client = Client(api_key="k")
-    ua = dict(client._client.headers).get("user-agent", "")
-    assert ua.startswith("visgate-sdk-python/")
-    client.close()
+def test_build_headers_returns_httpx_headers():
+    headers = _build_headers("k", fal_key="fal-test")
+    assert isinstance(headers, httpx.Headers)
+    assert headers["authorization"] == "Bearer k"
+    assert headers["x-fal-key"] == "fal-test"
+    assert "x-runway-key" not in headers
 
 
-def test_client_max_retries_default():
-    client = Client(api_key="k")
-    assert client.max_retries == 2
-    client.close()
+def test_client_max_retries_default(default_client):
+    assert default_client.max_retries == 2
 
 
 def test_client_max_retries_custom():
-    client = Client(api_key="k", max_retries=0)
-    assert client.max_retries == 0
-    client.close()
+    with Client(api_key="k", max_retries=0) as client:
+        assert client.max_retries == 0
 
 
 def test_client_context_manager():
@@ -172,24 +180,18 @@ def test_client_context_manager():
         assert client is not None
 
 
-def test_client_repr():
-    client = Client(api_key="k")
-    assert "visgateai.com" in repr(client)
-    client.close()
+def test_client_repr(default_client):
+    assert "visgateai.com" in repr(default_client)
 
 
-def test_client_generate_method():
+def test_client_generate_method(default_client):
     """generate() should be a proper method, not just a resource."""
-    client = Client(api_key="k")
-    assert callable(client.generate)
-    client.close()
+    assert callable(default_client.generate)
 
 
-def test_client_health_method():
+def test_client_health_method(default_client):
     """health() should be a proper method."""
-    client = Client(api_key="k")
-    assert callable(client.health)
-    client.close()
+    assert callable(default_client.health)
 
 
 # ---------------------------------------------------------------------------
@@ -198,18 +200,18 @@ def test_client_health_method():
 
 def test_handle_200():
     data = {"status": "ok"}
-    resp = _mock_response(200, json_data=data)
+    resp = _api_response(200, json_data=data)
     assert _handle_response(resp) == data
 
 
 def test_handle_401():
-    resp = _mock_response(401)
+    resp = _api_response(401)
     with pytest.raises(AuthenticationError):
         _handle_response(resp)
 
 
 def test_handle_422():
-    resp = _mock_response(
+    resp = _api_response(
         422, json_data={"message": "Invalid prompt", "details": {"field": "prompt"}}
     )
     with pytest.raises(ValidationError) as exc_info:
@@ -217,22 +219,31 @@ def test_handle_422():
     assert exc_info.value.field == "prompt"
 
 
+def test_handle_422_non_json_body():
+    resp = _api_response(422, json_data=None, text="Unprocessable")
+    with pytest.raises(ValidationError) as exc_info:
+        _handle_response(resp)
+    err = exc_info.value
+    assert err.message == "Unprocessable"
+    assert err.field is None
+
+
 def test_handle_429_with_retry():
-    resp = _mock_response(429, headers={"Retry-After": "30"})
+    resp = _api_response(429, headers={"Retry-After": "30"})
     with pytest.raises(RateLimitError) as exc_info:
         _handle_response(resp)
     assert exc_info.value.retry_after == 30
 
 
 def test_handle_429_without_retry():
-    resp = _mock_response(429, headers={})
+    resp = _api_response(429, headers={})
     with pytest.raises(RateLimitError) as exc_info:
         _handle_response(resp)
     assert exc_info.value.retry_after is None
 
 
 def test_handle_provider_error():
-    resp = _mock_response(
+    resp = _api_response(
         502,
         json_data={
             "error": "PROVIDER_FAILURE",
@@ -246,128 +257,456 @@ def test_handle_provider_error():
 
 
 def test_handle_generic_api_error():
-    resp = _mock_response(400, json_data={"error": "BAD_REQUEST", "message": "Invalid param"})
+    resp = _api_response(400, json_data={"error": "BAD_REQUEST", "message": "Invalid param"})
     with pytest.raises(VisgateError) as exc_info:
         _handle_response(resp)
     assert exc_info.value.error_code == "BAD_REQUEST"
 
 
+def test_handle_error_message_does_not_decode_text(monkeypatch):
+    def text(self):
+        raise AssertionError("response.text should not be decoded")
+
+    monkeypatch.setattr(httpx.Response, "text", property(text))
+    resp = httpx.Response(400, json={"error": "BAD_REQUEST", "message": "Invalid param"})
+    with pytest.raises(VisgateError) as exc_info:
+        _handle_response(resp)
+    assert exc_info.value.message == "Invalid param"
+
+
+@pytest.mark.parametrize("status", sorted(STATUS_TO_EXC))
+def test_handle_status_table(status):
+    resp = _api_response(status, json_data={"message": "x"})
+    with pytest.raises(STATUS_TO_EXC[status]) as exc_info:
+        _handle_response(resp)
+    assert exc_info.value.status_code == status
+
+
 def test_handle_non_json_error():
-    resp = _mock_response(500, json_data=None, text="Internal Server Error")
+    resp = _api_response(500, json_data=None, text="Internal Server Error")
     with pytest.raises(VisgateError) as exc_info:
         _handle_response(resp)
     assert "HTTP_500" in exc_info.value.error_code
 
 
 # ---------------------------------------------------------------------------
-# Exception classes
+# Retry transport
 # ---------------------------------------------------------------------------
 
-def test_visgate_error_str():
-    err = VisgateError("test msg", error_code="TEST")
-    assert str(err) == "[TEST] test msg"
-    assert err.message == "test msg"
-    assert err.error_code == "TEST"
-    assert err.details == {}
-    assert err.status_code is None
+def test_retry_transport_retries_retryable_status(monkeypatch):
+    monkeypatch.setattr("visgate_sdk._transport.time.sleep", lambda s: None)
+    statuses = iter([503, 429, 200])
+    transport = RetryTransport(
+        httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={})),
+        max_retries=2,
+    )
+    with httpx.Client(transport=transport) as http:
+        assert http.get("https://api.test/health").status_code == 200
+
+
+def test_retry_transport_returns_last_response_when_exhausted(monkeypatch):
+    monkeypatch.setattr("visgate_sdk._transport.time.sleep", lambda s: None)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500, json={})
 
+    with httpx.Client(transport=RetryTransport(httpx.MockTransport(handler), 1)) as http:
+        assert http.get("https://api.test/health").status_code == 500
+    assert len(calls) == 2
 
-def test_visgate_error_repr():
-    err = VisgateError("test msg", error_code="TEST")
-    assert "VisgateError" in repr(err)
 
+def test_retry_transport_does_not_sleep_past_budget(monkeypatch):
+    slept = []
+    monkeypatch.setattr("visgate_sdk._transport.time.sleep", slept.append)
+    transport = RetryTransport(
+        httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "60"})),
+        max_retries=2,
+        total_timeout=5.0,
+    )
+    with httpx.Client(transport=transport) as http:
+        assert http.get("https://api.test/health").status_code == 429
+    assert slept == []
+
+
+def test_retry_transport_retries_timeout_that_uses_the_whole_budget(monkeypatch):
+    monkeypatch.setattr("visgate_sdk._transport._backoff", lambda attempt: 0.0)
+    calls = []
 
-def test_authentication_error():
-    err = AuthenticationError()
-    assert err.error_code == "AUTHENTICATION_ERROR"
-    assert err.status_code == 401
+    def handler(request):
+        calls.append(1)
+        threading.Event().wait(0.2)  # longer than the whole retry budget
+        raise httpx.ReadTimeout("slow", request=request)
 
+    transport = RetryTransport(httpx.MockTransport(handler), max_retries=2, total_timeout=0.1)
+    with httpx.Client(transport=transport) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            client.get("https://api.test/")
+    assert len(calls) == 3
 
-def test_validation_error():
-    err = ValidationError("bad field", field="prompt")
-    assert err.error_code == "VALIDATION_ERROR"
-    assert err.field == "prompt"
-    assert err.status_code == 422
 
+def test_backoff_is_jittered():
+    waits = {_backoff(1) for _ in range(20)}
+    assert len(waits) > 1
+    assert all(0.5 <= w <= 1.5 for w in waits)
 
-def test_rate_limit_error():
-    err = RateLimitError(retry_after=60)
-    assert err.retry_after == 60
-    assert err.details == {"retry_after": 60}
-    assert err.status_code == 429
 
+def test_client_custom_transport():
+    seen = []
 
-def test_provider_error():
-    err = ProviderError("fail", provider="replicate")
-    assert err.provider == "replicate"
-    assert err.details == {"provider": "replicate"}
+    def handler(request):
+        seen.append(request.headers["authorization"])
+        return httpx.Response(200, json={"status": "ok"})
 
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        assert client.health() == {"status": "ok"}
+    assert seen == ["Bearer k"]
 
-def test_timeout_error():
-    err = TimeoutError("timed out")
-    assert err.error_code == "TIMEOUT_ERROR"
+
+def test_environment_proxies_from_env(monkeypatch):
+    for name in ("HTTP_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "proxy.test:8080")
+    monkeypatch.setenv("NO_PROXY", "localhost,::1,.internal.test")
+    assert _environment_proxies() == {
+        "https://": "http://proxy.test:8080",
+        "all://localhost": None,
+        "all://[::1]": None,
+        "all://*.internal.test": None,
+    }
 
 
-def test_connection_error():
-    err = ConnectionError("network down")
-    assert err.error_code == "CONNECTION_ERROR"
+def test_client_accepts_compressed_responses():
+    import gzip
+
+    def handler(request):
+        assert "gzip" in request.headers["accept-encoding"]
+        body = gzip.compress(json.dumps({"models": [{"id": "m"}], "total": 1}).encode())
+        return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        assert client.models.list().models[0].id == "m"
+
+
+def test_models_list_revalidates_with_etag():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"models": [{"id": "m"}]}, headers={"ETag": '"v1"'})
+
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        first = client.models.list(provider="fal")
+        first.models.clear()
+        again = client.models.list(provider="fal")
+        assert [m.id for m in again.models] == ["m"]
+        client.models.list(provider="replicate")
+    assert seen == [None, '"v1"', None]
+
+
+def test_models_get_drops_etag_when_response_has_none():
+    seen = []
+    etags = iter([{"ETag": '"v1"'}, {}, {}])
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, json={"id": "m"}, headers=next(etags))
+
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        for _ in range(3):
+            client.models.get("m")
+    assert seen == [None, '"v1"', None]
+
+
+def test_client_encodes_json_body():
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers["content-type"], json.loads(request.content)))
+        return httpx.Response(200, json={"valid": True, "message": "ok"})
+
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        assert client.providers.validate_key("fal", "fk").valid is True
+    assert seen == [("application/json", {"provider": "fal", "api_key": "fk"})]
+
+
+def test_client_maps_timeout_after_retries(monkeypatch):
+    monkeypatch.setattr("visgate_sdk._transport.time.sleep", lambda s: None)
+
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    with Client(api_key="k", max_retries=1, transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(TimeoutError, match="timed out"):
+            client.health()
 
 
 # ---------------------------------------------------------------------------
-# Data classes (from_dict)
+# Exception classes
 # ---------------------------------------------------------------------------
 
-def test_generate_result_from_dict():
-    data = {
-        "id": "gen-1",
-        "image_url": "https://img.test/1.png",
-        "images": ["https://img.test/1.png"],
-        "model": "fal-ai/flux/schnell",
-        "latency_ms": 1200,
-        "estimated_cost_usd": 0.003,
-        "cost_per_megapixel_usd": 0.005,
-        "resolution": {"width": 1024, "height": 1024},
-        "provider": "fal",
-        "mode": "managed",
-        "created_at": "2026-01-01T00:00:00Z",
-    }
-    result = GenerateResult.from_dict(data)
-    assert result.id == "gen-1"
-    assert result.image_url == "https://img.test/1.png"
-    assert result.cost == 0.003
-    assert result.provider == "fal"
-    assert result.mode == "managed"
-    assert result.created_at is not None
-    assert "gen-1" in repr(result)
+@pytest.fixture(scope="module")
+def sample_visgate_err():
+    return VisgateError("test msg", error_code="TEST")
 
 
-def test_model_info_from_dict():
-    data = {
-        "id": "fal-ai/flux/schnell",
-        "name": "FLUX Schnell",
-        "provider": "fal",
-        "media_type": "image",
-        "tags": ["fast", "text-to-image"],
-        "run_count": 5000,
-    }
-    model = ModelInfo.from_dict(data)
-    assert model.id == "fal-ai/flux/schnell"
-    assert model.provider == "fal"
-    assert "fast" in model.tags
-    assert "fal-ai/flux/schnell" in repr(model)
+def test_visgate_error_str(sample_visgate_err):
+    err = sample_visgate_err
+    assert str(err) == "[TEST] test msg"
+    assert err.message == "test msg"
+    assert err.error_code == "TEST"
+    assert err.details == {}
+    assert err.status_code is None
 
 
-def test_models_response_from_dict():
-    data = {
-        "models": [
-            {"id": "m1", "name": "M1", "provider": "fal", "media_type": "image"},
-            {"id": "m2", "name": "M2", "provider": "replicate", "media_type": "video"},
-        ],
-        "total_count": 2,
+def test_visgate_error_repr(sample_visgate_err):
+    assert "VisgateError" in repr(sample_visgate_err)
+
+
+def test_exception_classes():
+    cases = [
+        (AuthenticationError(), {"error_code": "AUTHENTICATION_ERROR", "status_code": 401}),
+        (
+            ValidationError("bad field", field="prompt"),
+            {"error_code": "VALIDATION_ERROR", "field": "prompt", "status_code": 422},
+        ),
+        (
+            RateLimitError(retry_after=60),
+            {"retry_after": 60, "details": {"retry_after": 60}, "status_code": 429},
+        ),
+        (
+            ProviderError("fail", provider="replicate"),
+            {"provider": "replicate", "details": {"provider": "replicate"}},
+        ),
+        (TimeoutError("timed out"), {"error_code": "TIMEOUT_ERROR"}),
+        (ConnectionError("network down"), {"error_code": "CONNECTION_ERROR"}),
+    ]
+    for err, expected in cases:
+        for attr, value in expected.items():
+            assert getattr(err, attr) == value, (type(err).__name__, attr)
+
+
+# ---------------------------------------------------------------------------
+# Data classes (from_dict)
+# ---------------------------------------------------------------------------
+
+_CREATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "cls, data, expected, in_repr",
+    [
+        pytest.param(
+            GenerateResult,
+            {
+                "id": "gen-1",
+                "image_url": "https://img.test/1.png",
+                "images": ["https://img.test/1.png"],
+                "model": "fal-ai/flux/schnell",
+                "latency_ms": 1200,
+                "estimated_cost_usd": 0.003,
+                "cost_per_megapixel_usd": 0.005,
+                "resolution": {"width": 1024, "height": 1024},
+                "provider": "fal",
+                "mode": "managed",
+                "created_at": "2026-01-01T00:00:00Z",
+            },
+            {
+                "id": "gen-1",
+                "image_url": "https://img.test/1.png",
+                "cost": 0.003,
+                "provider": "fal",
+                "mode": "managed",
+                "created_at": _CREATED,
+            },
+            "gen-1",
+            id="generate",
+        ),
+        pytest.param(
+            ModelInfo,
+            {
+                "id": "fal-ai/flux/schnell",
+                "name": "FLUX Schnell",
+                "provider": "fal",
+                "media_type": "image",
+                "tags": ["fast", "text-to-image"],
+                "run_count": 5000,
+            },
+            {"id": "fal-ai/flux/schnell", "provider": "fal", "tags": ["fast", "text-to-image"]},
+            "fal-ai/flux/schnell",
+            id="model-info",
+        ),
+        pytest.param(
+            ModelsResponse,
+            {
+                "models": [
+                    {"id": "m1", "name": "M1", "provider": "fal", "media_type": "image"},
+                    {"id": "m2", "name": "M2", "provider": "replicate", "media_type": "video"},
+                ],
+                "total_count": 2,
+            },
+            {
+                "total_count": 2,
+                "models": [
+                    ModelInfo("m1", "M1", "fal", "image"),
+                    ModelInfo("m2", "M2", "replicate", "video"),
+                ],
+            },
+            None,
+            id="models-response",
+        ),
+        pytest.param(
+            ImageResult,
+            {
+                "id": "img-1",
+                "images": ["https://img.test/a.png"],
+                "model": "flux",
+                "provider": "fal",
+                "latency_ms": 800,
+                "cache_hit": True,
+                "cost": 0.002,
+                "created_at": "2026-01-01T00:00:00Z",
+            },
+            {"id": "img-1", "cache_hit": True, "cost": 0.002, "created_at": _CREATED},
+            "img-1",
+            id="image",
+        ),
+        pytest.param(
+            VideoResult,
+            {
+                "id": "vid-1",
+                "video_url": "https://vid.test/v.mp4",
+                "model": "runway-gen3",
+                "provider": "runway",
+                "latency_ms": 15000,
+                "cache_hit": False,
+                "cost": 0.05,
+                "created_at": "2026-01-01T00:00:00Z",
+            },
+            {"id": "vid-1", "video_url": "https://vid.test/v.mp4", "provider": "runway"},
+            "vid-1",
+            id="video",
+        ),
+        pytest.param(
+            RequestStatusResult,
+            {
+                "request_id": "req-123",
+                "status": "completed",
+                "media_type": "video",
+                "provider": "fal",
+                "model": "fal-ai/veo3",
+                "output_url": "https://storage.example/v.mp4",
+                "error_message": None,
+            },
+            {
+                "request_id": "req-123",
+                "status": "completed",
+                "media_type": "video",
+                "output_url": "https://storage.example/v.mp4",
+                "is_terminal": True,
+            },
+            "req-123",
+            id="request-status",
+        ),
+        pytest.param(
+            UsageSummary,
+            {
+                "total_requests": 100,
+                "successful_requests": 95,
+                "failed_requests": 5,
+                "cached_requests": 20,
+                "total_provider_cost": 1.0,
+                "total_billed_cost": 1.2,
+                "total_savings": 0.2,
+                "period": "month",
+            },
+            {"total_requests": 100, "cache_hit_rate": 20.0, "total_billed_cost": 1.2},
+            "month",
+            id="usage-summary",
+        ),
+        pytest.param(
+            UsageSummary,
+            {
+                "total_requests": 10,
+                "total_cost_usd": 0.5,
+                "provider_breakdown": {"fal": 8, "replicate": 2},
+            },
+            {"total_billed_cost": 0.5, "by_provider": {"fal": 8, "replicate": 2}},
+            None,
+            id="usage-summary-legacy-keys",
+        ),
+        pytest.param(
+            ProviderKeyInfo,
+            {"provider": "fal", "validated": True, "masked_key": "fal_...abc"},
+            {"provider": "fal", "validated": True},
+            None,
+            id="provider-key",
+        ),
+        pytest.param(
+            ProviderKeysResponse,
+            {"keys": [{"provider": "fal", "validated": True}]},
+            {"keys": [ProviderKeyInfo("fal", True)]},
+            None,
+            id="provider-keys",
+        ),
+        pytest.param(
+            ProviderBalanceItem,
+            {
+                "provider": "replicate",
+                "configured": True,
+                "available": True,
+                "remaining": 5.0,
+                "currency": "USD",
+            },
+            {"provider": "replicate", "remaining": 5.0},
+            None,
+            id="provider-balance",
+        ),
+        pytest.param(
+            ProviderValidationResult,
+            {"valid": True, "message": "Key is valid"},
+            {"valid": True},
+            None,
+            id="provider-validation",
+        ),
+        pytest.param(
+            ProviderBalanceItem,
+            {"provider": "fal", "configured": 1, "available": "true"},
+            {"configured": True, "available": True},
+            None,
+            id="provider-balance-truthy-flags",
+        ),
+    ],
+)
+def test_from_dict(cls, data, expected, in_repr):
+    # Case data is built once at collection; a read-only view also proves from_dict never mutates it
+    result = cls.from_dict(MappingProxyType(data))
+    for attr, value in expected.items():
+        assert getattr(result, attr) == value, attr
+    if in_repr is not None:
+        assert in_repr in repr(result)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_response_dataclasses_use_slots():
+    info = ModelInfo.from_dict({"id": "m"})
+    assert not hasattr(info, "__dict__")
+    with pytest.raises(AttributeError):
+        info.unknown = 1
+    assert not hasattr(UsageSummary(), "__dict__")
+    assert not hasattr(RequestStatusResult.from_dict({}), "__dict__")
+
+
+def test_build_list_params_skips_unset_filters():
+    assert _build_list_params("fal", None, "", "fox", None, 10, True) == {
+        "limit": 10,
+        "provider": "fal",
+        "search": "fox",
+        "featured": "true",
     }
-    resp = ModelsResponse.from_dict(data)
-    assert resp.total_count == 2
-    assert len(resp.models) == 2
 
 
 def test_models_response_with_featured():
@@ -388,151 +727,347 @@ def test_models_response_with_featured():
     assert resp.featured[0].title == "Popular"
 
 
-def test_image_result_from_dict():
-    data = {
-        "id": "img-1",
-        "images": ["https://img.test/a.png"],
-        "model": "flux",
-        "provider": "fal",
-        "latency_ms": 800,
-        "cache_hit": True,
-        "cost": 0.002,
-        "created_at": "2026-01-01T00:00:00Z",
-    }
-    result = ImageResult.from_dict(data)
-    assert result.id == "img-1"
-    assert result.cache_hit is True
-    assert result.cost == 0.002
-    assert result.created_at is not None
-    assert "img-1" in repr(result)
+def test_shared_timestamps_are_parsed_once():
+    data = {"id": "a", "model": "m", "provider": "fal", "created_at": "2026-01-01T00:00:00Z"}
+    first = ImageResult.from_dict(data).created_at
+    assert ImageResult.from_dict(dict(data, id="b")).created_at is first
+    assert first.tzinfo is not None
 
 
-def test_video_result_from_dict():
-    data = {
-        "id": "vid-1",
-        "video_url": "https://vid.test/v.mp4",
-        "model": "runway-gen3",
-        "provider": "runway",
-        "latency_ms": 15000,
-        "cache_hit": False,
-        "cost": 0.05,
-        "created_at": "2026-01-01T00:00:00Z",
-    }
-    result = VideoResult.from_dict(data)
-    assert result.id == "vid-1"
-    assert result.video_url == "https://vid.test/v.mp4"
-    assert result.provider == "runway"
-    assert "vid-1" in repr(result)
+def _images_handler(request):
+    body = json.loads(request.content)
+    if body["prompt"] == "bad":
+        return httpx.Response(400, json={"error": "BAD_REQUEST", "message": "bad prompt"})
+    return httpx.Response(
+        200, json={"id": body["prompt"], "images": [], "model": body["model"], "provider": "fal"}
+    )
 
 
-def test_request_status_result_from_dict():
-    data = {
-        "request_id": "req-123",
-        "status": "completed",
-        "media_type": "video",
-        "provider": "fal",
-        "model": "fal-ai/veo3",
-        "output_url": "https://storage.example/v.mp4",
-        "error_message": None,
-    }
-    result = RequestStatusResult.from_dict(data)
-    assert result.request_id == "req-123"
+def test_images_generate_many_keeps_order_and_errors():
+    specs = [{"model": "m", "prompt": p} for p in ("a", "bad", "c")]
+    with Client(api_key="k", transport=httpx.MockTransport(_images_handler)) as client:
+        results = client.images.generate_many(specs, concurrency=2)
+    assert [r.id for r in (results[0], results[2])] == ["a", "c"]
+    assert isinstance(results[1], VisgateError)
+    assert results[1].message == "bad prompt"
+
+
+def test_images_generate_202_returns_generation_request():
+    def handler(request):
+        assert request.headers["prefer"] == "respond-async"
+        return httpx.Response(202, json={"request_id": "req-1", "status": "pending"})
+
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        pending = client.images.generate("m", "p", wait=False)
+    assert isinstance(pending, GenerationRequest)
+    assert pending.request_id == "req-1"
+
+
+def test_videos_generate_200_pending_body_returns_generation_request():
+    def handler(request):
+        return httpx.Response(200, json={"request_id": "req-2", "status": "pending"})
+
+    with Client(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        pending = client.videos.generate("m", "p", wait=False)
+    assert isinstance(pending, GenerationRequest)
+    assert pending.request_id == "req-2"
+
+
+@pytest.mark.asyncio
+async def test_async_images_generate_many_keeps_order_and_errors():
+    specs = [{"model": "m", "prompt": p} for p in ("a", "bad", "c")]
+    transport = httpx.MockTransport(_images_handler)
+    async with AsyncClient(api_key="k", transport=transport) as client:
+        results = await client.images.generate_many(specs, concurrency=2)
+    assert [r.id for r in (results[0], results[2])] == ["a", "c"]
+    assert isinstance(results[1], VisgateError)
+
+
+@pytest.mark.asyncio
+async def test_async_models_get_many():
+    def handler(request):
+        model_id = request.url.path.rsplit("/", 1)[-1]
+        if model_id == "missing":
+            return httpx.Response(404, json={"error": "NOT_FOUND", "message": "no such model"})
+        return httpx.Response(200, json={"id": model_id, "provider": "fal"})
+
+    async with AsyncClient(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        results = await client.models.get_many(["a", "missing", "b"])
+    assert results[0].id == "a" and results[2].id == "b"
+    assert isinstance(results[1], VisgateError)
+
+
+def test_requests_get_sends_long_poll_hint():
+    client = Mock(timeout=120.0)
+    client._send.return_value = (
+        httpx.Response(200),
+        {"request_id": "req-1", "status": "completed"},
+    )
+    Requests(client).get("req-1", wait=True, long_poll=30)
+    client._send.assert_called_once_with(
+        "GET", "/requests/req-1", params={"wait": 30}, timeout=150.0
+    )
+
+
+def test_requests_get_without_wait_ignores_long_poll():
+    client = Mock(timeout=120.0)
+    client._send.return_value = (
+        httpx.Response(200),
+        {"request_id": "req-1", "status": "processing"},
+    )
+    Requests(client).get("req-1", long_poll=30)
+    client._send.assert_called_once_with("GET", "/requests/req-1")
+
+
+def test_poll_delay_backs_off_with_jitter():
+    delays = [_poll_delay(2.0, 30.0, attempt, 300.0) for attempt in range(20)]
+    assert all(0.1 <= d <= 30.0 for d in delays)
+    assert len(set(delays)) > 1
+    assert _poll_delay(2.0, 30.0, 50, 0.5) <= 0.5
+
+
+def test_requests_get_skips_sleep_after_held_long_poll(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("visgate_sdk.resources.requests.time.sleep", sleeps.append)
+    client = Mock(timeout=120.0)
+    client._send.side_effect = [
+        (httpx.Response(200), {"request_id": "req-1", "status": "processing"}),
+        (httpx.Response(200), {"request_id": "req-1", "status": "completed"}),
+    ]
+    monkeypatch.setattr("visgate_sdk.resources.requests._held", lambda kwargs, s: True)
+    result = Requests(client).get("req-1", wait=True, long_poll=30)
     assert result.status == "completed"
-    assert result.media_type == "video"
-    assert result.output_url == "https://storage.example/v.mp4"
-    assert result.is_terminal is True
-    assert "req-123" in repr(result)
+    assert sleeps == []
+
+
+def test_requests_get_sleeps_for_server_hint(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("visgate_sdk.resources.requests.time.sleep", sleeps.append)
+    client = Mock(timeout=120.0)
+    client._send.side_effect = [
+        (httpx.Response(200, headers={"Retry-After": "7"}), {"status": "processing"}),
+        (
+            httpx.Response(200, headers={"X-Estimated-Completion-Ms": "1500"}),
+            {"status": "processing"},
+        ),
+        (httpx.Response(200), {"status": "completed"}),
+    ]
+    assert Requests(client).get("req-1", wait=True).status == "completed"
+    assert sleeps == [7.0, 1.5]
+
+
+def test_requests_get_many_stops_polling_finished_ids(monkeypatch):
+    monkeypatch.setattr("visgate_sdk.resources.requests.time.sleep", lambda s: None)
+    statuses = {"a": iter(["completed"]), "b": iter(["processing", "failed"])}
+    client = Mock(timeout=120.0)
+    client._send.side_effect = lambda method, path: (
+        httpx.Response(200),
+        {"request_id": path.rsplit("/", 1)[-1], "status": next(statuses[path.rsplit("/", 1)[-1]])},
+    )
+    results = Requests(client).get_many(["a", "b", "a"], wait=True)
+    assert {k: r.status for k, r in results.items()} == {"a": "completed", "b": "failed"}
+    assert [c.args[1] for c in client._send.call_args_list] == [
+        "/requests/a",
+        "/requests/b",
+        "/requests/b",
+    ]
+
+
+def test_requests_get_many_keeps_errors_and_honours_server_hint(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("visgate_sdk.resources.requests.time.sleep", sleeps.append)
+    client = Mock(timeout=120.0)
+    client._send.side_effect = [
+        VisgateError("no such request"),
+        (httpx.Response(200, headers={"Retry-After": "3"}), {"status": "processing"}),
+        (httpx.Response(200), {"status": "completed"}),
+    ]
+    results = Requests(client).get_many(["missing", "b"], wait=True)
+    assert isinstance(results["missing"], VisgateError)
+    assert results["b"].status == "completed"
+    assert sleeps == [3.0]
 
 
-def test_usage_summary_from_dict():
-    data = {
-        "total_requests": 100,
-        "successful_requests": 95,
-        "failed_requests": 5,
-        "cached_requests": 20,
-        "total_provider_cost": 1.0,
-        "total_billed_cost": 1.2,
-        "total_savings": 0.2,
-        "period": "month",
-    }
-    summary = UsageSummary.from_dict(data)
-    assert summary.total_requests == 100
-    assert summary.cache_hit_rate == 20.0
-    assert summary.total_billed_cost == 1.2
-    assert "month" in repr(summary)
+@pytest.mark.asyncio
+async def test_async_requests_get_many_keeps_errors_per_id():
+    def handler(request):
+        request_id = request.url.path.rsplit("/", 1)[-1]
+        if request_id == "missing":
+            return httpx.Response(404, json={"error": "NOT_FOUND", "message": "no such request"})
+        return httpx.Response(200, json={"request_id": request_id, "status": "completed"})
 
+    async with AsyncClient(api_key="k", transport=httpx.MockTransport(handler)) as client:
+        results = await client.requests.get_many(["a", "missing"], wait=True, concurrency=1)
+    assert results["a"].status == "completed"
+    assert isinstance(results["missing"], VisgateError)
 
-def test_usage_summary_zero_requests():
-    summary = UsageSummary.from_dict({"total_requests": 0})
-    assert summary.cache_hit_rate == 0.0
 
+@pytest.mark.asyncio
+async def test_async_requests_wait_all_settles_handles(monkeypatch):
+    monkeypatch.setattr("visgate_sdk.resources.requests.asyncio.sleep", AsyncMock())
+    client = Mock(timeout=120.0)
+    client._send = AsyncMock(
+        side_effect=[
+            (httpx.Response(200), {"request_id": "a", "status": "completed"}),
+            (httpx.Response(200), {"request_id": "b", "status": "processing"}),
+            (httpx.Response(200), {"request_id": "b", "status": "failed"}),
+        ]
+    )
+    a, b = AsyncGenerationRequest("a", client), AsyncGenerationRequest("b", client)
+    results = await AsyncRequests(client).wait_all([a, b])
+    assert {k: v.status for k, v in results.items()} == {"a": "completed", "b": "failed"}
+    assert (a.status, b.status) == ("completed", "failed")
+    assert await b.wait() is results["b"]
+    assert client._send.call_count == 3
+
+
+def test_held_needs_a_hint_and_nearly_the_full_window():
+    assert _held({"params": {"wait": 30}}, 28.0) is True
+    assert _held({"params": {"wait": 30}}, 20.0) is False
+    assert _held({"params": {"wait": 2}}, 2.0) is False
+    assert _held({}, 100.0) is False
+
+
+def test_requests_get_sleeps_when_long_poll_is_ignored(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("visgate_sdk.resources.requests.time.sleep", sleeps.append)
+    monkeypatch.setattr("visgate_sdk.resources.requests.random.uniform", lambda a, b: 0.0)
+    client = Mock(timeout=120.0)
+    client._send.side_effect = [
+        (httpx.Response(200), {"request_id": "req-1", "status": "processing"}),
+        (httpx.Response(200), {"request_id": "req-1", "status": "completed"}),
+    ]
+    Requests(client).get("req-1", wait=True, long_poll=2, poll_interval=1.5)
+    assert sleeps == [1.5]
+
+
+def test_generation_request_wait_caches_final_result():
+    client = Mock()
+    client.requests.get.return_value = RequestStatusResult.from_dict({"status": "completed"})
+    req = GenerationRequest("req-1", client=client)
+    assert req.wait() is req.wait()
+    assert req.status == "completed"
+    client.requests.get.assert_called_once()
+
+
+def test_generation_request_wait_times_out_behind_another_waiter():
+    req = GenerationRequest("req-1", client=Mock())
+    req._lock.acquire()
+    try:
+        with pytest.raises(TimeoutError, match="req-1"):
+            req.wait(timeout=0.05)
+    finally:
+        req._lock.release()
+    req._client.requests.get.assert_not_called()
 
-def test_usage_summary_backward_compat():
-    data = {
-        "total_requests": 10,
-        "total_cost_usd": 0.5,
-        "provider_breakdown": {"fal": 8, "replicate": 2},
-    }
-    summary = UsageSummary.from_dict(data)
-    assert summary.total_billed_cost == 0.5
-    assert summary.by_provider == {"fal": 8, "replicate": 2}
 
+@pytest.mark.asyncio
+async def test_async_generation_request_concurrent_waits_share_one_poll():
+    import asyncio
 
-def test_provider_key_info_from_dict():
-    data = {"provider": "fal", "validated": True, "masked_key": "fal_...abc"}
-    info = ProviderKeyInfo.from_dict(data)
-    assert info.provider == "fal"
-    assert info.validated is True
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return RequestStatusResult.from_dict({"status": "completed"})
 
+    client = Mock()
+    client.requests.get = AsyncMock(side_effect=slow_get)
+    req = AsyncGenerationRequest("req-1", client=client)
+    first, second = await asyncio.gather(req.wait(), req.wait())
+    assert first is second
+    assert (await req.wait()) is first
+    client.requests.get.assert_called_once()
 
-def test_provider_keys_response_from_dict():
-    data = {"keys": [{"provider": "fal", "validated": True}]}
-    resp = ProviderKeysResponse.from_dict(data)
-    assert len(resp.keys) == 1
 
+@pytest.mark.asyncio
+async def test_async_generation_request_joining_waiter_keeps_its_timeout():
+    release = asyncio.Event()
 
-def test_provider_balance_from_dict():
-    data = {
-        "provider": "replicate",
-        "configured": True,
-        "available": True,
-        "remaining": 5.0,
-        "currency": "USD",
-    }
-    balance = ProviderBalanceItem.from_dict(data)
-    assert balance.provider == "replicate"
-    assert balance.remaining == 5.0
+    async def slow_get(*args, **kwargs):
+        await release.wait()
+        return RequestStatusResult.from_dict({"status": "completed"})
 
+    client = Mock()
+    client.requests.get = AsyncMock(side_effect=slow_get)
+    req = AsyncGenerationRequest("req-1", client=client)
+    first = asyncio.ensure_future(req.wait(timeout=300))
+    await asyncio.sleep(0)
+    with pytest.raises(TimeoutError, match="req-1"):
+        await req.wait(timeout=0.05)
+    release.set()
+    assert (await first).status == "completed"
+    client.requests.get.assert_called_once()
 
-def test_provider_validation_result_from_dict():
-    data = {"valid": True, "message": "Key is valid"}
-    result = ProviderValidationResult.from_dict(data)
-    assert result.valid is True
 
+def test_generation_request_handles_exported():
+    import visgate_sdk
 
-# ---------------------------------------------------------------------------
-# Async client
-# ---------------------------------------------------------------------------
+    assert visgate_sdk.GenerationRequest is GenerationRequest
+    assert "AsyncGenerationRequest" in visgate_sdk.__all__
+    req = GenerationRequest("req-1", client=Mock())
+    assert req.request_id == "req-1"
+    assert "req-1" in repr(req)
+
+
+def test_usage_summary_zero_requests():
+    summary = UsageSummary.from_dict({"total_requests": 0})
+    assert summary.cache_hit_rate == 0.0
 
-def test_async_client_instantiates():
-    client = AsyncClient(api_key="test-key")
-    assert client.base_url == "https://visgateai.com/api/v1"
-    assert client.images is not None
-    assert client.models is not None
 
+def test_usage_get_reuses_recent_summary_within_max_age():
+    client = Mock()
+    client._request.return_value = {"total_requests": 3, "by_provider": {"fal": 3}}
+    usage = Usage(client)
+    first = usage.get("day", max_age=60)
+    first.by_provider["fal"] = 99
+    again = usage.get("day", max_age=60)
+    assert again.total_requests == 3 and again.by_provider == {"fal": 3}
+    assert client._request.call_count == 1
+    usage.get("day")
+    usage.invalidate()
+    usage.get("day", max_age=60)
+    assert client._request.call_count == 3
+
+
+def test_usage_dashboard_hits_are_independent_copies():
+    client = Mock()
+    client._request.return_value = {"totals": {"requests": 3}}
+    usage = Usage(client)
+    usage.dashboard(max_age=60)["totals"]["requests"] = 0
+    assert usage.dashboard(max_age=60) == {"totals": {"requests": 3}}
+    assert client._request.call_count == 1
 
-def test_async_client_from_env(monkeypatch):
-    monkeypatch.setenv("VISGATE_API_KEY", "vg-env-async")
-    client = AsyncClient()
-    assert client.api_key == "vg-env-async"
 
+def test_usage_iter_logs_pages_until_short_page():
+    client = Mock()
+    client._request.side_effect = [{"logs": [{"i": 0}, {"i": 1}]}, [{"i": 2}]]
+    assert [e["i"] for e in Usage(client).iter_logs(page_size=2)] == [0, 1, 2]
+    assert [c.kwargs["params"]["offset"] for c in client._request.call_args_list] == [0, 2]
 
-def test_async_client_repr():
-    client = AsyncClient(api_key="k")
-    assert "AsyncClient" in repr(client)
 
+def test_usage_iter_logs_stops_on_empty_page():
+    client = Mock()
+    client._request.side_effect = [[{"i": 0}, {"i": 1}], []]
+    assert [e["i"] for e in Usage(client).iter_logs(page_size=2)] == [0, 1]
+    assert client._request.call_count == 2
+
+
+def test_usage_iter_logs_rejects_non_positive_page_size():
+    client = Mock()
+    with pytest.raises(ValueError, match="page_size"):
+        next(Usage(client).iter_logs(page_size=0))
+    client._request.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Async client
+# ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_async_client_context_manager():
-    async with AsyncClient(api_key="k") as client:
-        assert client is not None
+async def test_async_client(monkeypatch):
+    monkeypatch.setenv("VISGATE_API_KEY", "vg-env-async")
+    async with AsyncClient() as client:
+        assert client.api_key == "vg-env-async"
+        assert client.base_url == "https://visgateai.com/api/v1"
+        assert client.images is not None
+        assert client.models is not None
+        assert "AsyncClient" in repr(client)